@@ -0,0 +1,93 @@
+import asyncio
+import logging
+from typing import List, Optional, Set
+from app.record import NewsRecord
+from app.search import Query, item_text, match_text
+
+logger = logging.getLogger(__name__)
+
+# 每个订阅者的待发送队列长度，写满说明客户端消费过慢
+SUBSCRIBER_QUEUE_SIZE = 256
+# 最多同时在线的订阅者数量
+MAX_SUBSCRIBERS = 1000
+
+
+class Subscription:
+    """单个推送订阅：按来源和关键词在服务端过滤，事件放入有界队列"""
+
+    def __init__(self, sources: Optional[Set[str]] = None, query: Optional[Query] = None, queue_size: int = SUBSCRIBER_QUEUE_SIZE):
+        self.sources = sources
+        self.query = query
+        self.queue: "asyncio.Queue[NewsRecord]" = asyncio.Queue(maxsize=queue_size)
+        # 因消费过慢被断开
+        self.dropped = False
+
+    def wants(self, item: NewsRecord) -> bool:
+        """条目是否符合订阅条件"""
+        if self.sources and item.source not in self.sources:
+            return False
+        if self.query and not match_text(self.query, item_text(item)):
+            return False
+        return True
+
+    async def get(self) -> Optional[NewsRecord]:
+        """等待下一条推送，被断开后返回 None"""
+        if self.dropped:
+            return None
+        item = await self.queue.get()
+        return None if self.dropped else item
+
+
+class NewsBroadcaster:
+    """新条目推送 - 入库后的新增条目分发给 SSE / WebSocket 订阅者"""
+
+    def __init__(self, max_subscribers: int = MAX_SUBSCRIBERS):
+        self.max_subscribers = max_subscribers
+        self._subscribers: List[Subscription] = []
+        self.dropped_count = 0
+
+    def subscribe(self, sources: Optional[Set[str]] = None, query: Optional[Query] = None) -> Subscription:
+        """新建订阅，超过上限抛出 RuntimeError"""
+        if len(self._subscribers) >= self.max_subscribers:
+            raise RuntimeError("订阅者数量已达上限")
+        subscription = Subscription(sources, query)
+        self._subscribers.append(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription):
+        """移除订阅"""
+        try:
+            self._subscribers.remove(subscription)
+        except ValueError:
+            pass
+
+    def publish(self, items: List[NewsRecord]):
+        """分发新增条目；队列已满的订阅者直接断开，不阻塞入库"""
+        if not items or not self._subscribers:
+            return
+
+        for subscription in list(self._subscribers):
+            for item in items:
+                if not subscription.wants(item):
+                    continue
+                try:
+                    subscription.queue.put_nowait(item)
+                except asyncio.QueueFull:
+                    self._drop(subscription)
+                    break
+
+    def _drop(self, subscription: Subscription):
+        """断开消费过慢的订阅者，唤醒其等待中的读取"""
+        subscription.dropped = True
+        self.unsubscribe(subscription)
+        self.dropped_count += 1
+        # 清掉一条腾出位置，放入占位条目以唤醒 get()
+        try:
+            subscription.queue.get_nowait()
+            subscription.queue.put_nowait(None)
+        except (asyncio.QueueEmpty, asyncio.QueueFull):
+            pass
+        logger.warning("推送订阅者消费过慢，已断开")
+
+    def __len__(self) -> int:
+        return len(self._subscribers)
@@ -1,39 +1,70 @@
-from typing import List, Dict
-from app.models import NewsItem
+import hashlib
+import time
+from collections import OrderedDict
+from typing import List
+from app.record import NewsRecord
+from app.matcher import get_matcher
+from app.search import item_text
+
+# 去重窗口（秒）：超过该时间未再出现的键被淘汰
+DEDUP_TTL = 48 * 3600
+# 最多保留的键数量（超出按最近最少使用淘汰）
+DEDUP_MAX_SIZE = 200000
 
 
 class NewsDeduplicator:
-    """基于来源+标题+发布时间的去重器（内存存储）"""
+    """
+    基于来源+标题+发布时间的去重器（内存存储）
+    只保存 64 位键哈希，按时间窗口和容量上限淘汰，长期运行内存保持稳定
+    """
+
+    def __init__(self, ttl: float = DEDUP_TTL, max_size: int = DEDUP_MAX_SIZE):
+        self.ttl = ttl
+        self.max_size = max_size
+        # 键哈希 -> 最近一次出现的时间，按出现时间排列（最旧的在前）
+        self._seen: "OrderedDict[int, float]" = OrderedDict()
 
-    def __init__(self):
-        self._seen: Dict[str, NewsItem] = {}
+    def _make_key(self, item: NewsRecord) -> int:
+        """生成唯一键：来源 + 标题 + 发布时间 的 64 位哈希"""
+        key = f"{item.source_id}|{item.title}|{item.published_ts}"
+        return int.from_bytes(hashlib.blake2b(key.encode('utf-8'), digest_size=8).digest(), 'big')
 
-    def _make_key(self, item: NewsItem) -> str:
-        """生成唯一键：来源 + 标题 + 发布时间"""
-        return f"{item.source}|{item.title}|{item.published_at}"
+    def _evict(self, now: float):
+        """淘汰过期和超出容量的键"""
+        cutoff = now - self.ttl
+        seen = self._seen
+        while seen:
+            key, seen_at = next(iter(seen.items()))
+            if seen_at >= cutoff and len(seen) <= self.max_size:
+                break
+            seen.popitem(last=False)
 
-    def deduplicate(self, items: List[NewsItem]) -> List[NewsItem]:
-        """去重并返回唯一条目"""
+    def deduplicate(self, items: List[NewsRecord]) -> List[NewsRecord]:
+        """去重并返回唯一条目（已见过的键会刷新时间，持续出现的条目不会被淘汰）"""
+        now = time.monotonic()
         unique_items = []
         for item in items:
             key = self._make_key(item)
-            if key not in self._seen:
-                self._seen[key] = item
+            if key in self._seen:
+                self._seen.move_to_end(key)
+            else:
                 unique_items.append(item)
+            self._seen[key] = now
+
+        self._evict(now)
         return unique_items
 
-    def filter_by_keywords(self, items: List[NewsItem], keywords: List[str]) -> List[NewsItem]:
+    def filter_by_keywords(self, items: List[NewsRecord], keywords: List[str]) -> List[NewsRecord]:
         """根据关键词过滤新闻"""
         if not keywords:
             return items
 
-        filtered = []
-        for item in items:
-            combined_text = f"{item.title} {item.summary} {item.source}".lower()
-            if any(kw.lower() in combined_text for kw in keywords):
-                filtered.append(item)
-        return filtered
+        matcher = get_matcher(keywords)
+        return [item for item in items if matcher.search(item_text(item))]
 
     def clear(self):
         """清空缓存"""
         self._seen.clear()
+
+    def __len__(self) -> int:
+        return len(self._seen)
@@ -0,0 +1,157 @@
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+from typing import Dict, Iterable, List, Optional
+import httpx
+
+logger = logging.getLogger(__name__)
+
+# Ollama 服务地址和模型
+OLLAMA_URL = os.getenv("OLLAMA_URL", "http://localhost:11434/api/generate")
+OLLAMA_MODEL = os.getenv("OLLAMA_MODEL", "qwen2.5:7b")
+# 每个请求翻译的文本条数
+LLM_BATCH_SIZE = 20
+# 同时进行中的请求数上限
+LLM_MAX_IN_FLIGHT = 2
+# 单个请求超时（秒）
+LLM_TIMEOUT = 60.0
+# 翻译缓存数据库路径（相对 backend 目录）
+TRANSLATION_DB_PATH = os.getenv("TRANSLATION_DB_PATH", "data/translations.db")
+
+_PROMPT = (
+    "你是专业的财经新闻翻译。把下面 JSON 数组中的每一条英文翻译成简体中文，"
+    "保留股票代码、公司名缩写和数字。只返回 JSON 对象 {{\"translations\": [...]}}，"
+    "数组长度和顺序必须与输入一致。\n{texts}"
+)
+
+
+class TranslationCache:
+    """持久化翻译缓存（SQLite，按模型 + 原文内容哈希索引，换模型后不会沿用旧模型的译文）"""
+
+    def __init__(self, db_path: str = TRANSLATION_DB_PATH):
+        directory = os.path.dirname(db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS translations ("
+            "text_hash TEXT PRIMARY KEY, translation TEXT NOT NULL)"
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def _hash(text: str, model: str) -> str:
+        return hashlib.sha256(f"{model}\0{text}".encode('utf-8')).hexdigest()
+
+    def get_many(self, texts: Iterable[str], model: str) -> Dict[str, str]:
+        """批量查询该模型的译文，返回命中的 原文 -> 译文"""
+        by_hash = {self._hash(text, model): text for text in texts}
+        if not by_hash:
+            return {}
+
+        result = {}
+        hashes = list(by_hash)
+        with self._lock:
+            # SQLite 参数个数有限制，分批查询
+            for start in range(0, len(hashes), 500):
+                chunk = hashes[start:start + 500]
+                rows = self._conn.execute(
+                    f"SELECT text_hash, translation FROM translations WHERE text_hash IN ({','.join('?' * len(chunk))})",
+                    chunk
+                ).fetchall()
+                for text_hash, translation in rows:
+                    result[by_hash[text_hash]] = translation
+        return result
+
+    def put_many(self, translations: Dict[str, str], model: str):
+        """批量写入该模型的译文"""
+        if not translations:
+            return
+        rows = [(self._hash(text, model), translation) for text, translation in translations.items()]
+        with self._lock, self._conn:
+            self._conn.executemany("INSERT OR REPLACE INTO translations VALUES (?, ?)", rows)
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+class LLMTranslator:
+    """
+    基于 Ollama 的批量翻译
+    相同文本只翻译一次：先去重、查持久化缓存，未命中的文本分批并发请求（限制并发数）
+    """
+
+    def __init__(
+        self,
+        url: str = OLLAMA_URL,
+        model: str = OLLAMA_MODEL,
+        batch_size: int = LLM_BATCH_SIZE,
+        max_in_flight: int = LLM_MAX_IN_FLIGHT,
+        cache: Optional[TranslationCache] = None,
+        client: Optional[httpx.AsyncClient] = None
+    ):
+        self.url = url
+        self.model = model
+        self.batch_size = batch_size
+        self.cache = cache if cache is not None else TranslationCache()
+        self.client = client if client is not None else httpx.AsyncClient(timeout=LLM_TIMEOUT)
+        self._semaphore = asyncio.Semaphore(max_in_flight)
+
+    async def _request_batch(self, texts: List[str]) -> Dict[str, str]:
+        """单个批次请求，失败时返回空结果（由调用方降级处理）"""
+        payload = {
+            "model": self.model,
+            "prompt": _PROMPT.format(texts=json.dumps(texts, ensure_ascii=False)),
+            "format": "json",
+            "stream": False
+        }
+        async with self._semaphore:
+            try:
+                response = await self.client.post(self.url, json=payload)
+                response.raise_for_status()
+                translations = json.loads(response.json()["response"])["translations"]
+            except Exception as e:
+                logger.warning(f"模型翻译请求失败 ({len(texts)} 条): {e}")
+                return {}
+
+        if not isinstance(translations, list) or len(translations) != len(texts):
+            logger.warning(f"模型翻译返回条数不匹配: 期望 {len(texts)}")
+            return {}
+        return {
+            text: str(translation).strip()
+            for text, translation in zip(texts, translations)
+            if str(translation).strip()
+        }
+
+    async def translate_many(self, texts: Iterable[str]) -> Dict[str, str]:
+        """批量翻译，返回 原文 -> 译文（翻译失败的文本不在结果中）"""
+        unique_texts = list(dict.fromkeys(text for text in texts if text and text.strip()))
+        if not unique_texts:
+            return {}
+
+        result = self.cache.get_many(unique_texts, self.model)
+        missing = [text for text in unique_texts if text not in result]
+        if not missing:
+            return result
+
+        batches = [missing[i:i + self.batch_size] for i in range(0, len(missing), self.batch_size)]
+        translated: Dict[str, str] = {}
+        for batch_result in await asyncio.gather(*(self._request_batch(batch) for batch in batches)):
+            translated.update(batch_result)
+
+        self.cache.put_many(translated, self.model)
+        result.update(translated)
+        logger.info(f"模型翻译: 缓存命中 {len(unique_texts) - len(missing)} 条, 新翻译 {len(translated)}/{len(missing)} 条")
+        return result
+
+    async def aclose(self):
+        await self.client.aclose()
+        self.cache.close()
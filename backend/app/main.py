@@ -1,14 +1,26 @@
-from fastapi import FastAPI, HTTPException, Query, BackgroundTasks
+import asyncio
+from fastapi import FastAPI, HTTPException, Query, BackgroundTasks, Request, Response, WebSocket, WebSocketDisconnect
+from fastapi.responses import StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
-from datetime import datetime, timedelta
-from typing import List, Optional
+from datetime import datetime
+from typing import List, Optional, Set
 import logging
-import asyncio
-from concurrent.futures import ThreadPoolExecutor
 
-from app.models import NewsItem, CrawlRequest, CrawlResponse, HealthResponse
+from app.broadcaster import NewsBroadcaster
+from app.models import NewsItem, CrawlRequest, CrawlResponse, HealthResponse, WatchlistRequest, WatchlistHit, NewsClusterResponse
+from app.matcher import get_matcher
+from app.near_dedup import NearDuplicateDetector
+from app.pagination import Entry, decode_cursor, paginate
+from app.record import NewsRecord, to_timestamp
 from app.deduplicator import NewsDeduplicator
+from app.repository import NewsRepository
+from app.response_cache import ResponseCache
+from app.scheduler import NewsScheduler
+from app.search import item_text, match_text, parse_query
+from app.store import NewsStore, day_range
+from app.translator import translator
 from scraper.manager import ScraperManager
+from scraper.single_flight import SingleFlight
 
 # 配置日志
 logging.basicConfig(
@@ -31,16 +43,143 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor", "ETag"],
 )
 
 # 全局去重器
 deduplicator = NewsDeduplicator()
+# 跨来源近似重复检测
+near_deduplicator = NearDuplicateDetector()
 # 爬虫管理器
 scraper_manager = ScraperManager()
 
-# 存储当前新闻数据（内存）
-current_news: List[NewsItem] = []
+# 分页每页最大条数
+MAX_PAGE_SIZE = 500
+# NDJSON 流式输出的批次大小
+STREAM_BATCH_SIZE = 200
+# SSE 心跳间隔（秒），防止代理断开空闲连接
+SSE_KEEPALIVE = 15
+# 相同的手动抓取（日期 + 来源集合）完成后结果复用的时间（秒），吸收开盘时的突发请求
+CRAWL_COALESCE_TTL = 10
+
+# 常热的新闻存储（内存），由后台调度器持续刷新
+news_store = NewsStore()
+# 持久化存储（SQLite），支撑历史日期查询和重启恢复
+news_repository = NewsRepository()
+# /news 预编码响应缓存（随新闻存储版本失效）
+news_response_cache = ResponseCache()
+# 新条目推送（SSE / WebSocket）
+news_broadcaster = NewsBroadcaster()
+# 并发的相同抓取只执行一次，调用方共享结果
+crawl_flights = SingleFlight(ttl=CRAWL_COALESCE_TTL)
 last_fetch_time: Optional[datetime] = None
+# 入库后在后台执行的翻译任务（保留引用，关闭时取消）
+translation_tasks: Set[asyncio.Task] = set()
+
+
+def _needs_translation(text: str) -> bool:
+    """非空且不含中文的文本才需要翻译"""
+    return bool(text and text.strip()) and not translator.is_chinese(text)
+
+
+def _untranslated(item: NewsRecord) -> List[str]:
+    """条目中需要翻译但还没有译文的文本"""
+    texts = []
+    if not item.title_zh and _needs_translation(item.title):
+        texts.append(item.title)
+    if not item.summary_zh and _needs_translation(item.summary):
+        texts.append(item.summary)
+    return texts
+
+
+def _translation_of(text: str, translations: dict) -> Optional[str]:
+    """译文；未翻译（如术语表没有命中、原样返回）时为 None，避免把原文当作译文保存"""
+    translated = translations.get(text)
+    if translated and translated.strip() != text.strip():
+        return translated
+    return None
+
+
+async def _translate_items(items: List[NewsRecord]) -> List[NewsRecord]:
+    """翻译还没有译文的非中文标题和摘要，结果写到条目上（请求时无需再翻译），返回得到新译文的条目"""
+    texts = [text for item in items for text in _untranslated(item)]
+    if not texts:
+        return []
+
+    translations = await translator.translate_many(texts)
+    translated = []
+    for item in items:
+        changed = False
+        if not item.title_zh and _needs_translation(item.title):
+            item.title_zh = _translation_of(item.title, translations)
+            changed = changed or item.title_zh is not None
+        if not item.summary_zh and _needs_translation(item.summary):
+            item.summary_zh = _translation_of(item.summary, translations)
+            changed = changed or item.summary_zh is not None
+        if changed:
+            translated.append(item)
+    return translated
+
+
+async def _translate_stored(items: List[NewsRecord]):
+    """为已入库的条目补充译文；失败只记录日志，条目保留原文"""
+    try:
+        translated = await _translate_items(items)
+    except Exception as e:
+        logger.error(f"翻译 {len(items)} 条新闻失败，保留原文: {e}")
+        return
+    if translated:
+        await asyncio.to_thread(news_repository.update_translations, translated)
+        # 译文是对已有条目的原地修改
+        news_store.touch()
+
+
+def _schedule_translation(items: List[NewsRecord]):
+    """在后台翻译，不阻塞入库和推送"""
+    items = [item for item in items if _untranslated(item)]
+    if not items:
+        return
+    task = asyncio.create_task(_translate_stored(items))
+    translation_tasks.add(task)
+    task.add_done_callback(translation_tasks.discard)
+
+
+async def _ingest(items: List[NewsItem]) -> List[NewsRecord]:
+    """转为紧凑记录，去重（精确 + 近似）后写入新闻存储并推送，再在后台翻译，返回新增记录"""
+    global last_fetch_time
+
+    records = []
+    for item in items:
+        try:
+            records.append(NewsRecord.from_item(item))
+        except ValueError:
+            logger.warning(f"{item.source} 发布时间格式无效，已跳过: {item.published_at}")
+
+    exact_unique = deduplicator.deduplicate(records)
+    unique_items = near_deduplicator.filter(exact_unique)
+    # SQLite 读写在线程池中执行（仓库内部加锁），不阻塞事件循环
+    await asyncio.to_thread(news_repository.add_many, unique_items)
+    # 近似重复会更新已有条目的 related_sources，写回数据库（同批新条目已随写入保存）
+    merged = near_deduplicator.take_updated()
+    if merged:
+        await asyncio.to_thread(news_repository.update_related_sources, merged)
+        news_store.touch()
+    news_store.add(unique_items)
+    news_broadcaster.publish(unique_items)
+    _schedule_translation(unique_items)
+    last_fetch_time = datetime.now()
+    return unique_items
+
+
+async def _on_scheduled_items(scraper, items: List[NewsItem]):
+    """后台调度器的回调"""
+    new_items = await _ingest(items)
+    if new_items:
+        logger.info(f"{scraper.get_source_name()} 定时刷新新增 {len(new_items)} 条")
+
+
+# 后台调度器
+scheduler = NewsScheduler(scraper_manager, _on_scheduled_items)
 
 
 @app.get("/health", response_model=HealthResponse)
@@ -49,115 +188,314 @@ async def health_check():
     return HealthResponse(status="ok", message="财经新闻爬虫服务运行中")
 
 
-def _run_crawl(target_date, keywords):
-    """在后台线程中运行爬虫任务（同步函数）"""
-    logger.info(f"[后台线程] 开始抓取新闻 - 日期: {target_date or '今日'}, 关键词: {keywords}")
-
-    # 清空去重缓存（每次抓取都获取最新数据）
-    deduplicator.clear()
-
-    # 抓取新闻（同步操作，在线程池中执行）
-    all_items, failed_sources = scraper_manager.fetch_all(target_date)
-
-    # 去重
-    unique_items = deduplicator.deduplicate(all_items)
-
-    # 关键词过滤
-    if keywords:
-        unique_items = deduplicator.filter_by_keywords(unique_items, keywords)
-
-    # 按时间倒序排序
-    unique_items.sort(key=lambda x: x.published_at, reverse=True)
-
-    logger.info(f"[后台线程] 抓取完成 - 成功: {len(unique_items)} 条, 失败来源: {failed_sources}")
-
-    return unique_items, failed_sources
-
-
 @app.post("/crawl", response_model=CrawlResponse)
 async def crawl_news(request: CrawlRequest = None):
     """
-    触发新闻抓取
+    立即触发新闻抓取（后台调度器会定时刷新，一般无需手动调用）
     - date: 目标日期 (YYYY-MM-DD)，可选，默认今日
-    - keywords: 关键词列表，可选
+    - keywords: 关键词列表，可选（仅影响返回的计数）
+    - sources: 来源名称列表，可选，默认全部来源
+    同一日期和来源集合的并发请求共用一次抓取，短时间内的重复请求直接复用结果
     """
-    global current_news, last_fetch_time
-
     try:
         target_date = request.date if request else None
         keywords = request.keywords if request else None
+        scrapers = scraper_manager.select_scrapers(request.sources if request else None)
+        if not scrapers:
+            raise HTTPException(status_code=400, detail="未找到指定的来源")
+        source_names = frozenset(scraper.get_source_name() for scraper in scrapers)
 
-        logger.info(f"开始抓取新闻 - 日期: {target_date or '今日'}, 关键词: {keywords}")
+        async def crawl():
+            logger.info(f"开始抓取新闻 - 日期: {target_date or '今日'}, 来源: {sorted(source_names)}")
+            # 未指定日期时增量抓取，结果合并到新闻存储
+            all_items, failed = await scraper_manager.fetch_all_async(target_date, incremental=not target_date, sources=source_names)
+            return await _ingest(all_items), failed
 
-        # 在线程池中执行爬虫任务，不阻塞事件循环
-        loop = asyncio.get_event_loop()
-        unique_items, failed_sources = await loop.run_in_executor(
-            None,  # 使用默认的 ThreadPoolExecutor
-            _run_crawl,
-            target_date,
-            keywords
-        )
+        unique_items, failed_sources = await crawl_flights.do((target_date, source_names), crawl)
+
+        # 关键词过滤
+        if keywords:
+            unique_items = deduplicator.filter_by_keywords(unique_items, keywords)
 
-        # 更新全局数据
-        current_news = unique_items
-        last_fetch_time = datetime.now()
+        logger.info(f"抓取完成 - 新增: {len(unique_items)} 条, 失败来源: {failed_sources}")
 
         return CrawlResponse(
-            success=len(failed_sources) < len(scraper_manager.scrapers),
+            success=len(failed_sources) < len(scrapers),
             count=len(unique_items),
             failed_sources=failed_sources,
             message=f"成功抓取 {len(unique_items)} 条新闻" + (f", {len(failed_sources)} 个来源失败" if failed_sources else "")
         )
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"抓取失败: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail=str(e))
 
 
-def _run_fetch_news(date, keyword_list):
-    """在后台线程中运行新闻获取任务"""
-    all_items, _ = scraper_manager.fetch_all(date)
-    items = deduplicator.deduplicate(all_items)
-    if keyword_list:
-        items = deduplicator.filter_by_keywords(items, keyword_list)
-    items.sort(key=lambda x: x.published_at, reverse=True)
-    return items
+def _search_repository(query, since=None, until=None, before=None) -> List[Entry]:
+    """持久化存储中按关键词过滤（逐条匹配，在线程池中执行）"""
+    entries = news_repository.query_entries(since=since, until=until, before=before)
+    return [entry for entry in entries if match_text(query, item_text(entry[2]))]
+
+
+async def _select_entries(query, since=None, until=None, before=None, limit=None) -> List[Entry]:
+    """
+    按条件选出条目（发布时间戳范围 [since, until)），按 (发布时间戳, id) 倒序
+    持久化存储的查询在线程池中执行，不阻塞事件循环
+    """
+    # 多取一条用于判断是否还有下一页
+    fetch_limit = limit + 1 if limit else None
+
+    # 保留期内的数据走内存存储（二分定位，关键词走倒排索引）
+    in_store = since >= news_store.cutoff if since is not None else until is None
+    if in_store:
+        if query:
+            return news_store.search_entries(query, since, until)
+        return news_store.query_entries(since=since, until=until, before=before, limit=fetch_limit)
+
+    # 更早的数据从持久化存储按索引查询
+    if query:
+        return await asyncio.to_thread(_search_repository, query, since, until, before)
+    return await asyncio.to_thread(news_repository.query_entries, since=since, until=until, before=before, limit=fetch_limit)
+
+
+def _time_range(date: Optional[str], since: Optional[str], until: Optional[str]):
+    """把 date / since / until 参数合并为发布时间戳范围，格式错误返回 400"""
+    try:
+        since_ts = to_timestamp(since) if since else None
+        until_ts = to_timestamp(until) if until else None
+        if date:
+            start, end = day_range(date)
+            since_ts = start if since_ts is None else max(since_ts, start)
+            until_ts = end if until_ts is None else min(until_ts, end)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=f"无效的时间参数: {e}")
+    return since_ts, until_ts
+
+
+def _parse_cursor(cursor: Optional[str]):
+    """解析游标参数，格式错误返回 400"""
+    if not cursor:
+        return None
+    try:
+        return decode_cursor(cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
 
 @app.get("/news", response_model=List[NewsItem])
 async def get_news(
+    request: Request,
     date: Optional[str] = Query(None, description="目标日期 (YYYY-MM-DD)"),
-    keywords: Optional[str] = Query(None, description="关键词，用逗号分隔")
+    since: Optional[str] = Query(None, description="发布时间下限（ISO 8601，含）"),
+    until: Optional[str] = Query(None, description="发布时间上限（ISO 8601，不含）"),
+    keywords: Optional[str] = Query(None, description="关键词：逗号分隔为 OR，空格分隔为 AND，引号内为短语"),
+    lang: Optional[str] = Query(None, description="zh 时标题和摘要返回中文译文"),
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE, description="每页条数，指定后分页返回"),
+    cursor: Optional[str] = Query(None, description="翻页游标（上一页响应头 X-Next-Cursor）")
 ):
     """
-    获取新闻列表
+    获取新闻列表（不在请求中抓取）
     - date: 目标日期，可选
-    - keywords: 关键词（逗号分隔），可选
+    - since / until: 发布时间范围，可选（可与 date 同时使用）
+      保留期内的数据从内存存储二分查找，更早的从持久化存储按索引查询
+    - keywords: 关键词查询，可选（如 `美联储 降息, "S&P 500"`）
+    - lang: zh 时返回入库时生成的中文译文，可选
+    - limit / cursor: 按 (发布时间, id) 的游标分页，下一页游标在响应头 X-Next-Cursor 中
+
+    响应按新闻存储版本预编码缓存，带强 ETag；If-None-Match 命中时返回 304
     """
-    global current_news
+    before = _parse_cursor(cursor)
+    since_ts, until_ts = _time_range(date, since, until)
 
     try:
-        keyword_list = [k.strip() for k in keywords.split(",")] if keywords else None
-
-        # 如果请求了特定日期或关键词，重新抓取（不阻塞）
-        if date or keyword_list:
-            loop = asyncio.get_event_loop()
-            items = await loop.run_in_executor(
-                None,
-                _run_fetch_news,
-                date,
-                keyword_list
-            )
-            return items
-
-        # 否则返回当前缓存的数据
-        return current_news
+        cache_key = (since_ts, until_ts, keywords, lang, limit, cursor)
+        version = news_store.version
+        encoded = news_response_cache.lookup(cache_key, version)
+        if encoded is None:
+            query = parse_query(keywords) if keywords else None
+            entries = await _select_entries(query, since_ts, until_ts, before, limit)
+            page, next_cursor = paginate(entries, before, limit)
+            headers = {"X-Next-Cursor": next_cursor} if next_cursor else None
+            data = [record.to_item(lang).model_dump() for _, _, record in page]
+            # 按查询开始时的版本缓存，期间有更新时下次请求会重新生成
+            encoded = news_response_cache.put(cache_key, version, data, headers)
+
+        accept_encoding = request.headers.get("accept-encoding", "")
+        matched_etag = encoded.match(request.headers.get("if-none-match"), accept_encoding)
+        if matched_etag:
+            # 回送命中的编码版本的 ETag，Vary 与 200 响应一致
+            return Response(status_code=304, headers={"ETag": matched_etag, "Vary": "Accept-Encoding", **encoded.headers})
+
+        body, content_encoding, etag = encoded.select(accept_encoding)
+        headers = {"ETag": etag, "Vary": "Accept-Encoding", **encoded.headers}
+        if content_encoding:
+            headers["Content-Encoding"] = content_encoding
+        return Response(content=body, media_type="application/json", headers=headers)
 
     except Exception as e:
         logger.error(f"获取新闻失败: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@app.get("/news/stream")
+async def stream_news(
+    date: Optional[str] = Query(None, description="目标日期 (YYYY-MM-DD)"),
+    since: Optional[str] = Query(None, description="发布时间下限（ISO 8601，含）"),
+    until: Optional[str] = Query(None, description="发布时间上限（ISO 8601，不含）"),
+    keywords: Optional[str] = Query(None, description="关键词：逗号分隔为 OR，空格分隔为 AND，引号内为短语"),
+    lang: Optional[str] = Query(None, description="zh 时标题和摘要返回中文译文")
+):
+    """
+    NDJSON 流式返回新闻（每行一条 JSON），适合批量拉取
+    参数同 /news，按批次编码输出，不在内存中拼接完整响应
+    """
+    query = parse_query(keywords) if keywords else None
+    since_ts, until_ts = _time_range(date, since, until)
+
+    async def generate():
+        if not query:
+            # 按游标分批读取
+            before = None
+            while True:
+                entries = await _select_entries(None, since_ts, until_ts, before, STREAM_BATCH_SIZE)
+                page, next_cursor = paginate(entries, None, STREAM_BATCH_SIZE)
+                if page:
+                    yield "".join(record.to_item(lang).model_dump_json() + "\n" for _, _, record in page)
+                if not next_cursor:
+                    break
+                before = decode_cursor(next_cursor)
+        else:
+            entries = await _select_entries(query, since_ts, until_ts)
+            for start in range(0, len(entries), STREAM_BATCH_SIZE):
+                batch = entries[start:start + STREAM_BATCH_SIZE]
+                yield "".join(record.to_item(lang).model_dump_json() + "\n" for _, _, record in batch)
+
+    return StreamingResponse(generate(), media_type="application/x-ndjson")
+
+
+def _subscribe(sources: Optional[str], keywords: Optional[str]):
+    """按来源（逗号分隔）和关键词创建推送订阅，超过上限返回 503"""
+    source_set = {s.strip() for s in sources.split(",") if s.strip()} if sources else None
+    query = parse_query(keywords) if keywords else None
+    try:
+        return news_broadcaster.subscribe(source_set, query)
+    except RuntimeError as e:
+        raise HTTPException(status_code=503, detail=str(e))
+
+
+@app.get("/news/events")
+async def news_events(
+    request: Request,
+    sources: Optional[str] = Query(None, description="来源过滤，逗号分隔（如 财联社,36氪）"),
+    keywords: Optional[str] = Query(None, description="关键词：逗号分隔为 OR，空格分隔为 AND，引号内为短语"),
+    lang: Optional[str] = Query(None, description="zh 时标题和摘要返回中文译文")
+):
+    """
+    SSE 推送新入库的条目（每条一个 news 事件，只推送订阅后新增的条目）
+    消费过慢的连接会被服务端断开，客户端重连后用 /news 补齐
+    """
+    subscription = _subscribe(sources, keywords)
+
+    async def generate():
+        try:
+            while not await request.is_disconnected():
+                try:
+                    record = await asyncio.wait_for(subscription.get(), timeout=SSE_KEEPALIVE)
+                except asyncio.TimeoutError:
+                    yield ": keepalive\n\n"
+                    continue
+                if record is None:
+                    break
+                yield f"event: news\ndata: {record.to_item(lang).model_dump_json()}\n\n"
+        finally:
+            news_broadcaster.unsubscribe(subscription)
+
+    return StreamingResponse(generate(), media_type="text/event-stream", headers={"Cache-Control": "no-cache"})
+
+
+@app.websocket("/news/ws")
+async def news_websocket(
+    websocket: WebSocket,
+    sources: Optional[str] = None,
+    keywords: Optional[str] = None,
+    lang: Optional[str] = None
+):
+    """WebSocket 推送新入库的条目（参数同 /news/events，每条一个 JSON 文本帧）"""
+    try:
+        subscription = _subscribe(sources, keywords)
+    except HTTPException:
+        await websocket.close(code=1013)
+        return
+
+    await websocket.accept()
+
+    async def wait_disconnect():
+        # 客户端不发送消息，读到断开即结束
+        while (await websocket.receive())["type"] != "websocket.disconnect":
+            pass
+
+    disconnect = asyncio.create_task(wait_disconnect())
+    try:
+        while True:
+            next_item = asyncio.create_task(subscription.get())
+            await asyncio.wait({next_item, disconnect}, return_when=asyncio.FIRST_COMPLETED)
+            if disconnect.done():
+                next_item.cancel()
+                break
+            record = next_item.result()
+            if record is None:
+                # 消费过慢被断开
+                await websocket.close(code=1008)
+                break
+            await websocket.send_text(record.to_item(lang).model_dump_json())
+    except WebSocketDisconnect:
+        pass
+    finally:
+        disconnect.cancel()
+        news_broadcaster.unsubscribe(subscription)
+
+
+@app.post("/watchlist", response_model=List[WatchlistHit])
+async def match_watchlist(request: WatchlistRequest):
+    """
+    自选列表匹配（股票代码、公司名、行业词等，可包含上百个关键词）
+    返回命中的新闻及命中的关键词
+    - date: 目标日期，可选，默认近期数据
+    """
+    try:
+        matcher = get_matcher(request.keywords)
+        if not len(matcher):
+            return []
+
+        if request.date:
+            records = await asyncio.to_thread(news_repository.query, date=request.date)
+        else:
+            records = news_store.query()
+        hits = []
+        for record in records:
+            matched = matcher.matches(item_text(record))
+            if matched:
+                hits.append(WatchlistHit(item=record.to_item(), matched=sorted(matched)))
+        return hits
+
+    except Exception as e:
+        logger.error(f"自选列表匹配失败: {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@app.get("/clusters", response_model=List[NewsClusterResponse])
+async def get_clusters(
+    min_sources: int = Query(2, ge=1, description="最少来源数")
+):
+    """获取跨来源转载的新闻聚类（规范条目 + 转载来源）"""
+    return [
+        NewsClusterResponse(canonical=cluster.canonical.to_item(), sources=cluster.sources, duplicates=cluster.duplicates)
+        for cluster in near_deduplicator.clusters(min_sources)
+    ]
+
+
 @app.get("/last-update")
 async def get_last_update():
     """获取上次更新时间"""
@@ -166,10 +504,45 @@ async def get_last_update():
     return {"last_update": None}
 
 
+@app.get("/pool-stats")
+async def get_pool_stats():
+    """获取各来源的连接池统计（连接数、复用率、握手次数）"""
+    return scraper_manager.pool_stats()
+
+
+@app.get("/scheduler")
+async def get_scheduler_status():
+    """获取后台调度器各来源的刷新状态"""
+    return scheduler.status()
+
+
+@app.on_event("startup")
+async def startup_event():
+    """从持久化存储恢复近期新闻，然后启动后台调度器"""
+    recent_records = await asyncio.to_thread(news_repository.query, since=news_store.cutoff)
+    # 按发布时间升序回放，最早出现的条目作为聚类的规范条目
+    restored = near_deduplicator.filter(deduplicator.deduplicate(recent_records[::-1]))
+    await asyncio.to_thread(news_repository.update_related_sources, near_deduplicator.take_updated())
+    news_store.add(restored)
+    # 重启前没来得及翻译或翻译失败的条目重新排队
+    _schedule_translation(restored)
+    # 没有发布时间的条目以首次发现时间入库，恢复后重启前后去重键一致
+    scraper_manager.restore_first_seen((record.source, record.url, record.published_ts) for record in reversed(recent_records))
+    logger.info(f"从数据库恢复 {len(recent_records)} 条新闻")
+
+    scheduler.start()
+
+
 @app.on_event("shutdown")
 async def shutdown_event():
     """关闭时清理资源"""
-    scraper_manager.close_all()
+    await scheduler.stop()
+    for task in list(translation_tasks):
+        task.cancel()
+    await asyncio.gather(*translation_tasks, return_exceptions=True)
+    await scraper_manager.close_all()
+    await translator.aclose()
+    news_repository.close()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,91 @@
+from collections import deque
+from functools import lru_cache
+from typing import Dict, FrozenSet, Iterable, List, Set, Tuple
+
+
+class KeywordMatcher:
+    """
+    Aho-Corasick 多关键词匹配器
+    一次扫描文本即可找出命中的全部关键词，耗时与关键词数量无关
+    （关键词和文本均按小写匹配）
+    """
+
+    def __init__(self, keywords: Iterable[str]):
+        self.keywords: List[str] = sorted({kw.lower() for kw in keywords if kw})
+        # 状态转移表、失败指针、每个状态的输出（关键词下标）
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[Tuple[int, ...]] = [()]
+        self._build()
+
+    def _build(self):
+        """构建 trie 和失败指针"""
+        outputs: List[List[int]] = [[]]
+        for index, keyword in enumerate(self.keywords):
+            state = 0
+            for char in keyword:
+                next_state = self._goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto[state][char] = next_state
+                    self._goto.append({})
+                    self._fail.append(0)
+                    outputs.append([])
+                state = next_state
+            outputs[state].append(index)
+
+        # 按层次遍历设置失败指针，并合并失败链上的输出
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fail = self._fail[state]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[next_state] = self._goto[fail].get(char, 0)
+                outputs[next_state].extend(outputs[self._fail[next_state]])
+
+        self._output = [tuple(output) for output in outputs]
+
+    def _scan(self, text: str) -> Iterable[Tuple[int, int]]:
+        """逐字符扫描，产出 (结束位置, 关键词下标)"""
+        goto, fail, output = self._goto, self._fail, self._output
+        state = 0
+        for position, char in enumerate(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            for index in output[state]:
+                yield position + 1, index
+
+    def matches(self, text: str) -> Set[str]:
+        """返回文本中命中的关键词"""
+        return {self.keywords[index] for _, index in self._scan(text.lower())}
+
+    def search(self, text: str) -> bool:
+        """文本是否命中任意关键词"""
+        for _ in self._scan(text.lower()):
+            return True
+        return False
+
+    def spans(self, text: str) -> List[Tuple[int, int, str]]:
+        """返回命中位置 (起始, 结束, 关键词)，可用于高亮"""
+        result = []
+        for end, index in self._scan(text.lower()):
+            keyword = self.keywords[index]
+            result.append((end - len(keyword), end, keyword))
+        return result
+
+    def __len__(self) -> int:
+        return len(self.keywords)
+
+
+@lru_cache(maxsize=256)
+def _compile(keywords: FrozenSet[str]) -> KeywordMatcher:
+    return KeywordMatcher(keywords)
+
+
+def get_matcher(keywords: Iterable[str]) -> KeywordMatcher:
+    """获取关键词集合对应的匹配器（按集合缓存，相同关键词集合只构建一次）"""
+    return _compile(frozenset(kw.strip().lower() for kw in keywords if kw and kw.strip()))
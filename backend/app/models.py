@@ -10,11 +10,33 @@ class NewsItem(BaseModel):
     url: str
     published_at: str
     fetched_at: str
+    # 转载了同一条新闻的其他来源（近似重复检测）
+    related_sources: list[str] = []
+    # 入库时生成的中文译文（原文为中文时为空）
+    title_zh: Optional[str] = None
+    summary_zh: Optional[str] = None
 
 
 class CrawlRequest(BaseModel):
     date: Optional[str] = None  # YYYY-MM-DD
     keywords: Optional[list[str]] = None
+    sources: Optional[list[str]] = None  # 只抓取指定来源，默认全部
+
+
+class WatchlistRequest(BaseModel):
+    keywords: list[str]
+    date: Optional[str] = None  # YYYY-MM-DD
+
+
+class WatchlistHit(BaseModel):
+    item: NewsItem
+    matched: list[str]
+
+
+class NewsClusterResponse(BaseModel):
+    canonical: NewsItem
+    sources: list[str]
+    duplicates: int
 
 
 class HealthResponse(BaseModel):
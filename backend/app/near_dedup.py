@@ -0,0 +1,191 @@
+import hashlib
+import random
+import re
+import time
+from collections import OrderedDict
+from typing import Dict, FrozenSet, List, Optional, Set, Tuple
+from app.record import NewsRecord
+
+# MinHash 签名长度与 LSH 分段：16 段 x 4 行，约在 Jaccard 相似度 0.5 附近开始成为候选
+NUM_PERM = 64
+BANDS = 16
+ROWS = NUM_PERM // BANDS
+# 候选聚类需通过精确校验：标题比较单元的 Jaccard 相似度不低于此值
+THRESHOLD = 0.8
+# 发布时间相差超过此值（秒）的不视为同一条新闻；聚类也在此时间后过期
+TIME_WINDOW = 12 * 3600
+# 最多保留的聚类数（超出按最早加入淘汰）
+MAX_CLUSTERS = 20000
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_rng = random.Random(20260111)
+_PERMUTATIONS = [(_rng.randrange(1, _MERSENNE_PRIME), _rng.randrange(0, _MERSENNE_PRIME)) for _ in range(NUM_PERM)]
+
+# 标题切分：英文单词和数字整体作为一个词，连续汉字再切成二元组
+_TOKEN_RE = re.compile(r'[a-z]+|\d+(?:\.\d+)?|[\u4e00-\u9fff]+')
+# 标题中的数字（涨跌幅、点位、金额），数字不同的视为不同新闻
+_NUMBER_RE = re.compile(r'\d+(?:\.\d+)?')
+
+
+def _shingles(text: str) -> Set[str]:
+    """
+    标题的比较单元：英文按词、数字按整数/小数、中文按字符二元组
+    忽略大小写、标点和空白，消除转载时的格式差异
+    """
+    shingles = set()
+    for token in _TOKEN_RE.findall(text.lower()):
+        if len(token) > 1 and '\u4e00' <= token[0] <= '\u9fff':
+            shingles.update(token[i:i + 2] for i in range(len(token) - 1))
+        else:
+            shingles.add(token)
+    return shingles
+
+
+def _hash64(token: str) -> int:
+    return int.from_bytes(hashlib.blake2b(token.encode('utf-8'), digest_size=8).digest(), 'big')
+
+
+def _numbers(text: str) -> FrozenSet[str]:
+    return frozenset(_NUMBER_RE.findall(text))
+
+
+def minhash(shingles: Set[str]) -> Tuple[int, ...]:
+    """比较单元集合的 MinHash 签名"""
+    if not shingles:
+        return ()
+    hashes = [_hash64(shingle) for shingle in shingles]
+    return tuple(
+        min((a * h + b) % _MERSENNE_PRIME for h in hashes)
+        for a, b in _PERMUTATIONS
+    )
+
+
+def _bands(signature: Tuple[int, ...]) -> List[Tuple[int, int]]:
+    return [(band, hash(signature[band * ROWS:(band + 1) * ROWS])) for band in range(BANDS)]
+
+
+def _jaccard(left: Set[str], right: Set[str]) -> float:
+    """精确 Jaccard 相似度"""
+    return len(left & right) / len(left | right)
+
+
+class NewsCluster:
+    """近似重复聚类：规范条目 + 各转载来源"""
+
+    __slots__ = ("canonical", "signature", "shingles", "numbers", "sources", "duplicates")
+
+    def __init__(self, canonical: NewsRecord, signature: Tuple[int, ...], shingles: Set[str]):
+        self.canonical = canonical
+        self.signature = signature
+        self.shingles = shingles
+        self.numbers = _numbers(canonical.title)
+        # 从数据库恢复的条目带有已持久化的转载来源
+        self.sources = [canonical.source] + [name for name in canonical.related_sources if name != canonical.source]
+        self.duplicates = len(self.sources) - 1
+
+
+class NearDuplicateDetector:
+    """
+    跨来源近似重复检测（MinHash + LSH 分段桶）
+    同一条快讯被不同来源以略有差异的标题或时间转载时，只保留最先出现的条目
+    LSH 只用于找候选，是否重复由标题精确相似度、数字和发布时间决定；同一来源的条目从不互相去重
+    """
+
+    def __init__(self, threshold: float = THRESHOLD, max_clusters: int = MAX_CLUSTERS,
+                 time_window: int = TIME_WINDOW):
+        self.threshold = threshold
+        self.max_clusters = max_clusters
+        self.time_window = time_window
+        self._clusters: "OrderedDict[int, NewsCluster]" = OrderedDict()
+        self._buckets: Dict[Tuple[int, int], List[int]] = {}
+        self._next_id = 0
+        # 本次以来新增了转载来源的规范条目（由调用方取走并持久化）
+        self._updated: Dict[int, NewsRecord] = {}
+
+    def _matches(self, cluster: NewsCluster, item: NewsRecord, shingles: Set[str]) -> bool:
+        """是否为该聚类的跨来源转载：与规范条目来源不同、发布时间相近、数字一致、标题足够相似"""
+        return (
+            item.source_id != cluster.canonical.source_id
+            and abs(item.published_ts - cluster.canonical.published_ts) <= self.time_window
+            and _numbers(item.title) == cluster.numbers
+            and _jaccard(shingles, cluster.shingles) >= self.threshold
+        )
+
+    def _find(self, item: NewsRecord, signature: Tuple[int, ...], shingles: Set[str]) -> Optional[NewsCluster]:
+        """在同段桶中查找该条目所属的聚类"""
+        checked = set()
+        for key in _bands(signature):
+            for cluster_id in self._buckets.get(key, ()):
+                if cluster_id in checked:
+                    continue
+                checked.add(cluster_id)
+                cluster = self._clusters[cluster_id]
+                if self._matches(cluster, item, shingles):
+                    return cluster
+        return None
+
+    def _remove_cluster(self, cluster_id: int, cluster: NewsCluster):
+        for key in _bands(cluster.signature):
+            bucket = self._buckets.get(key)
+            if bucket:
+                bucket.remove(cluster_id)
+                if not bucket:
+                    del self._buckets[key]
+
+    def _add_cluster(self, item: NewsRecord, signature: Tuple[int, ...], shingles: Set[str]):
+        self._next_id += 1
+        self._clusters[self._next_id] = NewsCluster(item, signature, shingles)
+        for key in _bands(signature):
+            self._buckets.setdefault(key, []).append(self._next_id)
+
+        while len(self._clusters) > self.max_clusters:
+            self._remove_cluster(*self._clusters.popitem(last=False))
+
+    def _expire(self):
+        """淘汰发布时间已超出时间窗口的聚类（按加入顺序，遇到未过期的即停止）"""
+        horizon = int(time.time()) - self.time_window
+        while self._clusters:
+            cluster_id, cluster = next(iter(self._clusters.items()))
+            if cluster.canonical.published_ts >= horizon:
+                break
+            del self._clusters[cluster_id]
+            self._remove_cluster(cluster_id, cluster)
+
+    def filter(self, items: List[NewsRecord]) -> List[NewsRecord]:
+        """返回不是其他来源已有条目近似重复的新条目；重复条目计入对应聚类的来源"""
+        self._expire()
+        unique_items = []
+        for item in items:
+            shingles = _shingles(item.title)
+            signature = minhash(shingles)
+            if not signature:
+                unique_items.append(item)
+                continue
+
+            cluster = self._find(item, signature, shingles)
+            if cluster is None:
+                self._add_cluster(item, signature, shingles)
+                unique_items.append(item)
+                continue
+
+            if item.source in cluster.sources:
+                # 已记录过的转载来源（如重启后再次抓取到被合并的转载）
+                continue
+            cluster.duplicates += 1
+            cluster.sources.append(item.source)
+            cluster.canonical.related_sources = cluster.sources[1:]
+            self._updated[id(cluster.canonical)] = cluster.canonical
+        return unique_items
+
+    def take_updated(self) -> List[NewsRecord]:
+        """取走转载来源有变化的规范条目"""
+        updated = list(self._updated.values())
+        self._updated.clear()
+        return updated
+
+    def clusters(self, min_sources: int = 2) -> List[NewsCluster]:
+        """返回来源数不少于 min_sources 的聚类（最新的在前）"""
+        return [cluster for cluster in reversed(self._clusters.values()) if len(cluster.sources) >= min_sources]
+
+    def __len__(self) -> int:
+        return len(self._clusters)
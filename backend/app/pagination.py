@@ -0,0 +1,48 @@
+import base64
+from typing import List, Optional, Tuple
+from app.record import NewsRecord
+
+# (发布时间戳, id, 记录)，列表按 (发布时间戳, id) 倒序排列
+Entry = Tuple[int, int, NewsRecord]
+
+
+def encode_cursor(published_ts: int, entry_id: int) -> str:
+    """生成翻页游标（不透明字符串）"""
+    return base64.urlsafe_b64encode(f"{published_ts}|{entry_id}".encode('utf-8')).decode('ascii')
+
+
+def decode_cursor(cursor: str) -> Tuple[int, int]:
+    """解析翻页游标，格式错误时抛出 ValueError"""
+    try:
+        published_ts, entry_id = base64.urlsafe_b64decode(cursor.encode('ascii')).decode('utf-8').split("|")
+        return int(published_ts), int(entry_id)
+    except Exception:
+        raise ValueError(f"无效的游标: {cursor}")
+
+
+def _first_after(entries: List[Entry], before: Tuple[int, int]) -> int:
+    """二分查找第一个排在游标之后（即 (发布时间戳, id) 更小）的位置"""
+    lo, hi = 0, len(entries)
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if (entries[mid][0], entries[mid][1]) < before:
+            hi = mid
+        else:
+            lo = mid + 1
+    return lo
+
+
+def paginate(entries: List[Entry], before: Optional[Tuple[int, int]], limit: Optional[int]) -> Tuple[List[Entry], Optional[str]]:
+    """
+    按游标取一页
+    返回: (本页条目, 下一页游标，None 表示没有更多)
+    """
+    start = _first_after(entries, before) if before else 0
+    if not limit:
+        return entries[start:], None
+
+    page = entries[start:start + limit]
+    if start + limit < len(entries):
+        last = page[-1]
+        return page, encode_cursor(last[0], last[1])
+    return page, None
@@ -0,0 +1,113 @@
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional, Tuple
+from app.models import NewsItem
+
+
+class SourceTable:
+    """来源名称驻留：每个来源名只保存一份，记录中只存小整数 id"""
+
+    def __init__(self):
+        self._ids: Dict[str, int] = {}
+        self._names: List[str] = []
+
+    def intern(self, name: str) -> int:
+        source_id = self._ids.get(name)
+        if source_id is None:
+            source_id = len(self._names)
+            self._ids[name] = source_id
+            self._names.append(name)
+        return source_id
+
+    def name(self, source_id: int) -> str:
+        return self._names[source_id]
+
+
+# 进程内共享的来源表
+sources = SourceTable()
+
+# 统一使用北京时间
+CST = timezone(timedelta(hours=8))
+
+
+def to_timestamp(value: str) -> int:
+    """ISO 8601 时间转为 epoch 秒（不带时区的按北京时间）"""
+    dt = datetime.fromisoformat(value)
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=CST)
+    return int(dt.timestamp())
+
+
+def format_timestamp(ts: int) -> str:
+    """epoch 秒转为 ISO 8601（北京时间，带 +08:00）"""
+    return datetime.fromtimestamp(ts, CST).isoformat()
+
+
+class NewsRecord:
+    """
+    内存中的紧凑新闻记录
+    来源为驻留的 id，时间为 epoch 整数秒；只在接口返回时转换为 NewsItem
+    """
+
+    __slots__ = ("source_id", "title", "summary", "url", "published_ts", "fetched_ts",
+                 "related_ids", "title_zh", "summary_zh")
+
+    def __init__(self, source_id: int, title: str, summary: str, url: str, published_ts: int, fetched_ts: int,
+                 related_ids: Tuple[int, ...] = (), title_zh: Optional[str] = None, summary_zh: Optional[str] = None):
+        self.source_id = source_id
+        self.title = title
+        self.summary = summary
+        self.url = url
+        self.published_ts = published_ts
+        self.fetched_ts = fetched_ts
+        self.related_ids = related_ids
+        self.title_zh = title_zh
+        self.summary_zh = summary_zh
+
+    @classmethod
+    def from_item(cls, item: NewsItem) -> "NewsRecord":
+        return cls(
+            source_id=sources.intern(item.source),
+            title=item.title,
+            summary=item.summary,
+            url=item.url,
+            published_ts=to_timestamp(item.published_at),
+            fetched_ts=to_timestamp(item.fetched_at),
+            related_ids=tuple(sources.intern(name) for name in item.related_sources),
+            title_zh=item.title_zh,
+            summary_zh=item.summary_zh
+        )
+
+    @property
+    def source(self) -> str:
+        return sources.name(self.source_id)
+
+    @property
+    def published_at(self) -> str:
+        return format_timestamp(self.published_ts)
+
+    @property
+    def fetched_at(self) -> str:
+        return format_timestamp(self.fetched_ts)
+
+    @property
+    def related_sources(self) -> List[str]:
+        return [sources.name(source_id) for source_id in self.related_ids]
+
+    @related_sources.setter
+    def related_sources(self, names: List[str]):
+        self.related_ids = tuple(sources.intern(name) for name in names)
+
+    def to_item(self, lang: Optional[str] = None) -> NewsItem:
+        """转换为接口模型；lang 为 zh 时标题和摘要使用译文"""
+        zh = lang == "zh"
+        return NewsItem(
+            source=self.source,
+            title=(self.title_zh if zh and self.title_zh else self.title),
+            summary=(self.summary_zh if zh and self.summary_zh else self.summary),
+            url=self.url,
+            published_at=self.published_at,
+            fetched_at=self.fetched_at,
+            related_sources=self.related_sources,
+            title_zh=self.title_zh,
+            summary_zh=self.summary_zh
+        )
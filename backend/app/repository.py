@@ -0,0 +1,216 @@
+import json
+import logging
+import os
+import sqlite3
+import threading
+from typing import List, Optional, Tuple
+from app.record import NewsRecord, sources, to_timestamp
+
+logger = logging.getLogger(__name__)
+
+# 数据库文件路径（相对 backend 目录）
+DB_PATH = os.getenv("NEWS_DB_PATH", "data/news.db")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS news (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    dedup_key TEXT NOT NULL UNIQUE,
+    source TEXT NOT NULL,
+    title TEXT NOT NULL,
+    summary TEXT NOT NULL,
+    url TEXT NOT NULL,
+    published_at TEXT NOT NULL,
+    published_ts INTEGER,
+    published_date TEXT NOT NULL,
+    fetched_at TEXT NOT NULL,
+    title_zh TEXT,
+    summary_zh TEXT,
+    related_sources TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_news_published_at ON news (published_at);
+CREATE INDEX IF NOT EXISTS idx_news_source_published_at ON news (source, published_at);
+CREATE INDEX IF NOT EXISTS idx_news_published_date ON news (published_date, published_at);
+"""
+
+# 依赖迁移列的索引（补齐列之后再建）
+_INDEXES = """
+CREATE INDEX IF NOT EXISTS idx_news_published_ts ON news (published_ts, id);
+CREATE INDEX IF NOT EXISTS idx_news_date_ts ON news (published_date, published_ts, id);
+"""
+
+_COLUMNS = "source, title, summary, url, published_ts, fetched_at, title_zh, summary_zh, related_sources"
+
+# 旧版本数据库缺少的列（启动时补齐）
+_MIGRATIONS = {
+    "title_zh": "ALTER TABLE news ADD COLUMN title_zh TEXT",
+    "summary_zh": "ALTER TABLE news ADD COLUMN summary_zh TEXT",
+    "published_ts": "ALTER TABLE news ADD COLUMN published_ts INTEGER",
+    "related_sources": "ALTER TABLE news ADD COLUMN related_sources TEXT",
+}
+
+
+class NewsRepository:
+    """SQLite 新闻持久化存储（WAL 模式，批量写入）"""
+
+    def __init__(self, db_path: str = DB_PATH):
+        self.db_path = db_path
+        directory = os.path.dirname(db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        existing = {row[1] for row in self._conn.execute("PRAGMA table_info(news)")}
+        for column, statement in _MIGRATIONS.items():
+            if column not in existing:
+                self._conn.execute(statement)
+        # 旧数据补齐发布时间戳
+        self._conn.create_function("to_timestamp", 1, to_timestamp)
+        self._conn.execute("UPDATE news SET published_ts = to_timestamp(published_at) WHERE published_ts IS NULL")
+        self._conn.executescript(_INDEXES)
+        self._conn.commit()
+
+    @staticmethod
+    def _make_key(item: NewsRecord) -> str:
+        """与去重器一致的唯一键：来源 + 标题 + 发布时间"""
+        return f"{item.source}|{item.title}|{item.published_at}"
+
+    @staticmethod
+    def _to_record(row: tuple) -> NewsRecord:
+        source, title, summary, url, published_ts, fetched_at, title_zh, summary_zh, related_sources = row
+        record = NewsRecord(
+            source_id=sources.intern(source),
+            title=title,
+            summary=summary,
+            url=url,
+            published_ts=published_ts,
+            fetched_ts=to_timestamp(fetched_at),
+            title_zh=title_zh,
+            summary_zh=summary_zh
+        )
+        if related_sources:
+            record.related_sources = json.loads(related_sources)
+        return record
+
+    @staticmethod
+    def _related_json(item: NewsRecord) -> Optional[str]:
+        """转载来源列表存为 JSON 数组，没有转载时为 NULL"""
+        return json.dumps(item.related_sources, ensure_ascii=False) if item.related_ids else None
+
+    def add_many(self, items: List[NewsRecord]) -> int:
+        """批量写入（单个事务），已存在的条目被忽略，返回写入条数"""
+        if not items:
+            return 0
+
+        rows = []
+        for item in items:
+            published_at = item.published_at
+            rows.append((
+                self._make_key(item), item.source, item.title, item.summary, item.url,
+                published_at, item.published_ts, published_at[:10], item.fetched_at,
+                item.title_zh, item.summary_zh, self._related_json(item)
+            ))
+        with self._lock, self._conn:
+            before = self._conn.total_changes
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO news "
+                "(dedup_key, source, title, summary, url, published_at, published_ts, published_date, fetched_at, "
+                "title_zh, summary_zh, related_sources) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                rows
+            )
+            return self._conn.total_changes - before
+
+    def update_translations(self, items: List[NewsRecord]) -> int:
+        """写入已入库条目的译文（单个事务），返回更新条数"""
+        if not items:
+            return 0
+
+        rows = [(item.title_zh, item.summary_zh, self._make_key(item)) for item in items]
+        with self._lock, self._conn:
+            before = self._conn.total_changes
+            self._conn.executemany("UPDATE news SET title_zh = ?, summary_zh = ? WHERE dedup_key = ?", rows)
+            return self._conn.total_changes - before
+
+    def update_related_sources(self, items: List[NewsRecord]) -> int:
+        """写入已入库条目的转载来源（近似重复合并到聚类时调用），返回更新条数"""
+        if not items:
+            return 0
+
+        rows = [(self._related_json(item), self._make_key(item)) for item in items]
+        with self._lock, self._conn:
+            before = self._conn.total_changes
+            self._conn.executemany("UPDATE news SET related_sources = ? WHERE dedup_key = ?", rows)
+            return self._conn.total_changes - before
+
+    def query(
+        self,
+        date: Optional[str] = None,
+        since: Optional[int] = None,
+        until: Optional[int] = None,
+        source: Optional[str] = None,
+        limit: Optional[int] = None
+    ) -> List[NewsRecord]:
+        """
+        查询新闻，按发布时间倒序
+        - date: 发布日期 (YYYY-MM-DD)
+        - since / until: 发布时间戳范围（含 since 不含 until）
+        - source: 来源名称
+        """
+        return [item for _, _, item in self.query_entries(date, since, until, source, limit=limit)]
+
+    def query_entries(
+        self,
+        date: Optional[str] = None,
+        since: Optional[int] = None,
+        until: Optional[int] = None,
+        source: Optional[str] = None,
+        before: Optional[Tuple[int, int]] = None,
+        limit: Optional[int] = None
+    ) -> List[Tuple[int, int, NewsRecord]]:
+        """
+        查询新闻，返回 (发布时间戳, id, 记录)，按 (发布时间戳, id) 倒序
+        - before: 游标，只返回排在 (发布时间戳, id) 之后的条目
+        """
+        conditions = []
+        params: list = []
+        if date:
+            conditions.append("published_date = ?")
+            params.append(date)
+        if since is not None:
+            conditions.append("published_ts >= ?")
+            params.append(since)
+        if until is not None:
+            conditions.append("published_ts < ?")
+            params.append(until)
+        if source:
+            conditions.append("source = ?")
+            params.append(source)
+        if before:
+            conditions.append("(published_ts, id) < (?, ?)")
+            params.extend(before)
+
+        sql = f"SELECT id, {_COLUMNS} FROM news"
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+        sql += " ORDER BY published_ts DESC, id DESC"
+        if limit:
+            sql += " LIMIT ?"
+            params.append(limit)
+
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        return [(row[5], row[0], self._to_record(row[1:])) for row in rows]
+
+    def count(self) -> int:
+        """条目总数"""
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM news").fetchone()[0]
+
+    def close(self):
+        """关闭数据库连接"""
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,116 @@
+import gzip
+import hashlib
+from collections import OrderedDict
+from typing import Callable, Hashable, List, Optional, Tuple
+import orjson
+
+try:
+    import brotli
+except ImportError:  # brotli 为可选依赖
+    brotli = None
+
+# 小于该大小的响应不压缩（字节）
+MIN_COMPRESS_SIZE = 1024
+# 最多缓存的响应数
+MAX_ENTRIES = 64
+
+
+class EncodedResponse:
+    """预编码的响应体（原始 JSON 及压缩版本）"""
+
+    __slots__ = ("etag", "body", "gzip", "br", "headers")
+
+    def __init__(self, body: bytes, headers: Optional[dict] = None):
+        self.etag = hashlib.sha1(body).hexdigest()[:20]
+        self.body = body
+        self.headers = headers or {}
+        self.gzip: Optional[bytes] = None
+        self.br: Optional[bytes] = None
+        if len(body) >= MIN_COMPRESS_SIZE:
+            self.gzip = gzip.compress(body, compresslevel=6)
+            if brotli is not None:
+                self.br = brotli.compress(body, quality=5)
+
+    def select(self, accept_encoding: str) -> Tuple[bytes, Optional[str], str]:
+        """按 Accept-Encoding 选择编码，返回 (响应体, Content-Encoding, ETag)"""
+        accept_encoding = accept_encoding.lower()
+        if self.br is not None and "br" in accept_encoding:
+            return self.br, "br", f'"{self.etag}-br"'
+        if self.gzip is not None and "gzip" in accept_encoding:
+            return self.gzip, "gzip", f'"{self.etag}-gzip"'
+        return self.body, None, f'"{self.etag}"'
+
+    def variant_etags(self) -> List[str]:
+        """各编码版本的 ETag（不带引号）"""
+        tags = [self.etag]
+        if self.gzip is not None:
+            tags.append(f"{self.etag}-gzip")
+        if self.br is not None:
+            tags.append(f"{self.etag}-br")
+        return tags
+
+    def match(self, if_none_match: Optional[str], accept_encoding: str = "") -> Optional[str]:
+        """
+        If-None-Match 命中时返回应在 304 中回送的 ETag（命中的编码版本），未命中返回 None
+        任一编码版本的 ETag 均视为命中；* 时回送按 Accept-Encoding 选择的版本
+        """
+        if not if_none_match:
+            return None
+        tags = self.variant_etags()
+        for tag in if_none_match.split(","):
+            tag = tag.strip()
+            if tag == "*":
+                return self.select(accept_encoding)[2]
+            if tag.startswith("W/"):
+                tag = tag[2:]
+            tag = tag.strip('"')
+            if tag in tags:
+                return f'"{tag}"'
+        return None
+
+
+class ResponseCache:
+    """
+    按存储版本缓存预编码的响应
+    存储版本不变时，相同查询直接返回已编码（及压缩）的字节，不再重复校验和序列化
+    """
+
+    def __init__(self, max_entries: int = MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, Tuple[int, EncodedResponse]]" = OrderedDict()
+
+    def get(
+        self,
+        key: Hashable,
+        version: int,
+        build: Callable[[], Tuple[object, Optional[dict]]]
+    ) -> EncodedResponse:
+        """
+        获取缓存的响应，版本变化或未缓存时调用 build 重新生成
+        build 返回 (可 JSON 序列化的数据, 额外响应头)
+        """
+        cached = self.lookup(key, version)
+        if cached is not None:
+            return cached
+        data, headers = build()
+        return self.put(key, version, data, headers)
+
+    def lookup(self, key: Hashable, version: int) -> Optional[EncodedResponse]:
+        """版本一致的缓存响应，没有时返回 None（需要异步生成响应时与 put 配合使用）"""
+        cached = self._entries.get(key)
+        if cached is not None and cached[0] == version:
+            self._entries.move_to_end(key)
+            return cached[1]
+        return None
+
+    def put(self, key: Hashable, version: int, data: object, headers: Optional[dict] = None) -> EncodedResponse:
+        """编码并缓存响应"""
+        encoded = EncodedResponse(orjson.dumps(data), headers)
+        self._entries[key] = (version, encoded)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return encoded
+
+    def clear(self):
+        self._entries.clear()
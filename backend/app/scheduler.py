@@ -0,0 +1,86 @@
+import asyncio
+import logging
+import random
+from datetime import datetime
+from typing import Awaitable, Callable, Dict, List, Optional
+from app.models import NewsItem
+from scraper.base_scraper import BaseScraper
+from scraper.manager import ScraperManager
+
+logger = logging.getLogger(__name__)
+
+# 刷新间隔的随机抖动比例（避免各来源同时请求）
+JITTER_RATIO = 0.1
+# 连续失败时的最大退避间隔（秒）
+MAX_BACKOFF = 1800
+
+
+class NewsScheduler:
+    """后台调度器 - 按各来源自己的刷新间隔增量抓取，保持新闻存储常热"""
+
+    def __init__(self, manager: ScraperManager, on_items: Callable[[BaseScraper, List[NewsItem]], Awaitable[None]]):
+        self.manager = manager
+        self.on_items = on_items
+        self._tasks: List[asyncio.Task] = []
+        self._failures: Dict[str, int] = {}
+        self._last_run: Dict[str, datetime] = {}
+
+    def start(self):
+        """为每个来源启动一个刷新任务"""
+        if self._tasks:
+            return
+        for scraper in self.manager.scrapers:
+            self._tasks.append(asyncio.create_task(self._run_source(scraper)))
+        logger.info(f"后台调度器已启动，共 {len(self._tasks)} 个来源")
+
+    async def stop(self):
+        """停止所有刷新任务"""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks.clear()
+
+    def _next_delay(self, scraper: BaseScraper) -> float:
+        """计算下次刷新间隔：失败时指数退避，并加入随机抖动"""
+        failures = self._failures.get(scraper.get_source_name(), 0)
+        delay = min(scraper.refresh_interval * (2 ** failures), max(MAX_BACKOFF, scraper.refresh_interval))
+        return delay * random.uniform(1 - JITTER_RATIO, 1 + JITTER_RATIO)
+
+    async def _run_source(self, scraper: BaseScraper):
+        """单个来源的刷新循环"""
+        name = scraper.get_source_name()
+        while True:
+            try:
+                items, failed = await self.manager.fetch_source(scraper, incremental=True)
+                # 失败只影响退避；已取到的条目照常入库（如 API 熔断后网页备用方案抓到的条目）
+                if failed:
+                    self._failures[name] = self._failures.get(name, 0) + 1
+                else:
+                    self._failures[name] = 0
+                if items or not failed:
+                    await self.on_items(scraper, items)
+                self._last_run[name] = datetime.now()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self._failures[name] = self._failures.get(name, 0) + 1
+                logger.error(f"{name} 定时刷新异常: {e}", exc_info=True)
+
+            await asyncio.sleep(self._next_delay(scraper))
+
+    def status(self) -> Dict[str, dict]:
+        """各来源的调度状态"""
+        result = {}
+        for scraper in self.manager.scrapers:
+            name = scraper.get_source_name()
+            last_run: Optional[datetime] = self._last_run.get(name)
+            result[name] = {
+                "interval": scraper.refresh_interval,
+                "failures": self._failures.get(name, 0),
+                "last_run": last_run.isoformat() if last_run else None,
+                "circuit": scraper.breaker.snapshot(),
+                "date_fallbacks": scraper.date_fallbacks,
+            }
+            if scraper.feed_status:
+                result[name]["feeds"] = dict(scraper.feed_status)
+        return result
@@ -0,0 +1,132 @@
+import re
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+from app.record import NewsRecord
+
+# 分词片段：连续的英文/数字，或连续的中文
+_SEGMENT_RE = re.compile(r'[a-z0-9]+|[\u4e00-\u9fff]+')
+_CJK_RE = re.compile(r'[\u4e00-\u9fff]')
+# 查询中的 OR 分隔符：逗号（含全角）、竖线、OR
+_OR_RE = re.compile(r'\s*(?:,|，|\||\bOR\b)\s*')
+# 查询中的词项：引号内为短语，否则按空白切分
+_TERM_RE = re.compile(r'"([^"]+)"|(\S+)')
+
+Query = List[List[str]]
+
+
+def parse_query(query: str) -> Query:
+    """
+    解析关键词查询，返回 OR 连接的 AND 子句
+    - 逗号 / | / OR 分隔的子句之间为 OR（兼容原有的逗号分隔关键词）
+    - 子句内空白分隔的词项之间为 AND
+    - 引号内为短语，整体匹配
+    """
+    clauses = []
+    for part in _OR_RE.split(query or ""):
+        terms = []
+        for phrase, word in _TERM_RE.findall(part):
+            term = (phrase or word).strip().lower()
+            if term and term != "and":
+                terms.append(term)
+        if terms:
+            clauses.append(terms)
+    return clauses
+
+
+def item_text(item: NewsRecord) -> str:
+    """参与检索的文本：标题 + 摘要 + 来源"""
+    return f"{item.title} {item.summary} {item.source}".lower()
+
+
+def match_text(query: Query, text: str) -> bool:
+    """判断文本是否满足查询（子串语义）"""
+    return any(all(term in text for term in clause) for clause in query)
+
+
+def _text_grams(text: str) -> Set[str]:
+    """文档的索引单元：中文单字 + 所有片段的二元组"""
+    grams = set()
+    for segment in _SEGMENT_RE.findall(text):
+        if _CJK_RE.match(segment):
+            grams.update(segment)
+        grams.update(segment[i:i + 2] for i in range(len(segment) - 1))
+    return grams
+
+
+def _term_grams(term: str) -> Set[str]:
+    """查询词项的索引单元（单个英文字符无法用索引约束，直接忽略）"""
+    grams = set()
+    for segment in _SEGMENT_RE.findall(term):
+        if len(segment) == 1:
+            if _CJK_RE.match(segment):
+                grams.add(segment)
+        else:
+            grams.update(segment[i:i + 2] for i in range(len(segment) - 1))
+    return grams
+
+
+class SearchIndex:
+    """
+    关键词倒排索引（标题、摘要、来源）
+    中文按单字和二元组切分，英文和数字按二元组切分；
+    通过倒排表求交集得到候选，再做子串校验保证结果精确
+    """
+
+    def __init__(self):
+        self._postings: Dict[str, Set[int]] = {}
+        self._docs: Dict[int, Tuple[str, NewsRecord]] = {}
+
+    def add(self, doc_id: int, item: NewsRecord):
+        """写入文档"""
+        text = item_text(item)
+        self._docs[doc_id] = (text, item)
+        for gram in _text_grams(text):
+            self._postings.setdefault(gram, set()).add(doc_id)
+
+    def remove(self, doc_id: int):
+        """移除文档"""
+        doc = self._docs.pop(doc_id, None)
+        if doc is None:
+            return
+        for gram in _text_grams(doc[0]):
+            postings = self._postings.get(gram)
+            if postings is not None:
+                postings.discard(doc_id)
+                if not postings:
+                    del self._postings[gram]
+
+    def get(self, doc_id: int) -> NewsRecord:
+        """按 id 取文档"""
+        return self._docs[doc_id][1]
+
+    def _candidates(self, clause: List[str]) -> Optional[Set[int]]:
+        """子句的候选文档（None 表示无法用索引约束）"""
+        grams = set()
+        for term in clause:
+            grams |= _term_grams(term)
+        if not grams:
+            return None
+
+        postings = sorted((self._postings.get(gram, set()) for gram in grams), key=len)
+        result = set(postings[0])
+        for other in postings[1:]:
+            if not result:
+                break
+            result &= other
+        return result
+
+    def search(self, query: Query) -> List[int]:
+        """返回匹配查询的文档 id"""
+        matched: Set[int] = set()
+        for clause in query:
+            candidates = self._candidates(clause)
+            doc_ids: Iterable[int] = self._docs.keys() if candidates is None else candidates
+            for doc_id in doc_ids:
+                if doc_id in matched:
+                    continue
+                text = self._docs[doc_id][0]
+                if all(term in text for term in clause):
+                    matched.add(doc_id)
+        return list(matched)
+
+    def __len__(self) -> int:
+        return len(self._docs)
@@ -0,0 +1,129 @@
+import heapq
+import time
+from bisect import bisect_left
+from datetime import datetime
+from typing import List, Optional, Tuple
+from app.pagination import Entry
+from app.record import CST, NewsRecord
+from app.search import Query, SearchIndex
+
+
+def day_range(date: str) -> Tuple[int, int]:
+    """日期 (YYYY-MM-DD，北京时间) 对应的时间戳区间 [开始, 结束)"""
+    start = int(datetime.strptime(date, "%Y-%m-%d").replace(tzinfo=CST).timestamp())
+    return start, start + 86400
+
+
+class NewsStore:
+    """
+    内存新闻存储 - 由后台调度器持续写入，接口直接读取
+    条目按 (发布时间戳, id) 升序保存，日期、时间范围、最新 N 条和游标翻页都通过二分查找定位
+    """
+
+    def __init__(self, retention_days: int = 7):
+        self.retention_days = retention_days
+        # (发布时间戳, 文档 id, 记录)，按 (发布时间戳, id) 升序排列
+        self._entries: List[Entry] = []
+        self._next_id = 0
+        # 关键词倒排索引，随写入和过期同步更新
+        self.index = SearchIndex()
+        # 每次内容变化递增，便于调用方判断数据是否更新
+        self.version = 0
+        self.last_update: Optional[datetime] = None
+
+    def add(self, records: List[NewsRecord]) -> int:
+        """合并新记录（调用方负责去重），返回新增条数"""
+        if records:
+            new_entries = []
+            for record in records:
+                self._next_id += 1
+                new_entries.append((record.published_ts, self._next_id, record))
+                self.index.add(self._next_id, record)
+            new_entries.sort(key=lambda x: (x[0], x[1]))
+
+            # 新条目通常都比已有条目新，直接追加；否则归并（不对整个列表重新排序）
+            if not self._entries or new_entries[0][:2] > self._entries[-1][:2]:
+                self._entries.extend(new_entries)
+            else:
+                self._entries = list(heapq.merge(self._entries, new_entries, key=lambda x: (x[0], x[1])))
+            self._prune()
+            self.version += 1
+        self.last_update = datetime.now()
+        return len(records)
+
+    def touch(self):
+        """已有条目被原地修改时调用，使依赖版本的缓存失效"""
+        self.version += 1
+
+    @property
+    def cutoff(self) -> int:
+        """保留期起点（时间戳）"""
+        return int(time.time()) - self.retention_days * 86400
+
+    def _prune(self):
+        """移除超出保留期的条目（位于列表开头）"""
+        end = bisect_left(self._entries, (self.cutoff,))
+        if end:
+            for _, doc_id, _ in self._entries[:end]:
+                self.index.remove(doc_id)
+            del self._entries[:end]
+
+    def _bounds(self, since: Optional[int], until: Optional[int], before: Optional[Tuple[int, int]]) -> Tuple[int, int]:
+        """[since, until) 且排在游标 before 之后的区间下标"""
+        entries = self._entries
+        lo = bisect_left(entries, (since,)) if since is not None else 0
+        hi = bisect_left(entries, (until,)) if until is not None else len(entries)
+        if before is not None:
+            hi = min(hi, bisect_left(entries, before))
+        return lo, max(lo, hi)
+
+    def query(self, date: Optional[str] = None) -> List[NewsRecord]:
+        """按日期 (YYYY-MM-DD) 查询，未指定日期返回全部，按发布时间倒序"""
+        return [record for _, _, record in self.query_entries(date)]
+
+    def query_entries(
+        self,
+        date: Optional[str] = None,
+        since: Optional[int] = None,
+        until: Optional[int] = None,
+        before: Optional[Tuple[int, int]] = None,
+        limit: Optional[int] = None
+    ) -> List[Entry]:
+        """
+        查询 (发布时间戳, 文档 id, 记录)，按 (发布时间戳, id) 倒序
+        - date: 发布日期 (YYYY-MM-DD)
+        - since / until: 发布时间戳范围（含 since 不含 until）
+        - before: 游标，只返回排在 (发布时间戳, id) 之后的条目
+        - limit: 最多返回的条数（最新的 N 条）
+        """
+        if date:
+            start, end = day_range(date)
+            since = start if since is None else max(since, start)
+            until = end if until is None else min(until, end)
+        lo, hi = self._bounds(since, until, before)
+        if limit is not None:
+            lo = max(lo, hi - limit)
+        return self._entries[lo:hi][::-1]
+
+    def latest(self, limit: int) -> List[NewsRecord]:
+        """最新的 N 条"""
+        return [record for _, _, record in self.query_entries(limit=limit)]
+
+    def search(self, query: Query) -> List[NewsRecord]:
+        """关键词检索（倒排索引），按发布时间倒序返回"""
+        return [record for _, _, record in self.search_entries(query)]
+
+    def search_entries(self, query: Query, since: Optional[int] = None, until: Optional[int] = None) -> List[Entry]:
+        """同 search，返回 (发布时间戳, 文档 id, 记录)，可按发布时间戳范围过滤"""
+        entries = []
+        for doc_id in self.index.search(query):
+            record = self.index.get(doc_id)
+            ts = record.published_ts
+            if (since is not None and ts < since) or (until is not None and ts >= until):
+                continue
+            entries.append((ts, doc_id, record))
+        entries.sort(key=lambda x: (x[0], x[1]), reverse=True)
+        return entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -1,21 +1,50 @@
-import httpx
+import json
 import logging
-from typing import Optional
+import os
+from functools import lru_cache
+from typing import Dict, Iterable, Optional
 import re
+from app.llm_translator import LLMTranslator
 
 logger = logging.getLogger(__name__)
 
+_CHINESE_RE = re.compile(r'[\u4e00-\u9fff]')
+
+# 术语表文件（按类别分组的 英文 -> 中文 映射）
+GLOSSARY_PATH = os.path.join(os.path.dirname(__file__), "data", "glossary.json")
+# 翻译结果缓存条数
+TRANSLATION_CACHE_SIZE = 10000
+# 翻译后端：glossary（关键词替换）或 llm（Ollama 模型批量翻译）
+TRANSLATION_BACKEND = os.getenv("TRANSLATION_BACKEND", "glossary")
+
+
+def load_glossary(path: str = GLOSSARY_PATH) -> Dict[str, str]:
+    """加载术语表并展开分组"""
+    with open(path, encoding="utf-8") as f:
+        groups = json.load(f)
+    glossary = {}
+    for terms in groups.values():
+        glossary.update(terms)
+    return glossary
+
 
 class Translator:
-    """翻译器 - 快速关键词替换"""
+    """翻译器 - 快速关键词替换，可选基于模型的批量翻译"""
 
-    def __init__(self):
-        self.client = httpx.Client(timeout=5.0)
-        self.ollama_url = "http://localhost:11434/api/generate"
+    def __init__(self, glossary_path: str = GLOSSARY_PATH, backend: str = TRANSLATION_BACKEND):
+        self.backend = backend
+        # 模型翻译后端（backend="llm" 时在首次使用时创建）
+        self._llm: Optional[LLMTranslator] = None
+
+        # 术语表只加载一次，编译成单个正则（长词优先，如 "Dow Jones" 先于 "Dow"）
+        self.glossary = load_glossary(glossary_path)
+        alternation = "|".join(re.escape(term) for term in sorted(self.glossary, key=len, reverse=True))
+        self._pattern = re.compile(r'(?<![A-Za-z0-9_])(?:' + alternation + r')(?![A-Za-z0-9_])')
+        self._translate_cached = lru_cache(maxsize=TRANSLATION_CACHE_SIZE)(self._replace_terms)
 
     def is_chinese(self, text: str) -> bool:
         """检测文本是否包含中文"""
-        return bool(re.search(r'[\u4e00-\u9fff]', text))
+        return bool(_CHINESE_RE.search(text))
 
     def translate_to_chinese(self, text: str) -> str:
         """
@@ -33,78 +62,34 @@ class Translator:
         return self._simple_translate(text)
 
     def _simple_translate(self, text: str) -> str:
-        """快速翻译 - 使用关键词替换"""
-        terms = {
-            # 股票市场
-            "Stock": "股票", "stocks": "股票", "stock": "股票",
-            "market": "市场", "Market": "市场",
-            "shares": "股份", "share": "股份",
-            "portfolio": "投资组合",
-            "dividend": "股息", "dividends": "股息",
-            "yield": "收益率",
-
-            # 利率/央行
-            "Fed": "美联储", "Federal Reserve": "美联储",
-            "Rate": "利率", "rate": "利率", "rates": "利率",
-            "interest rates": "利率",
-            "inflation": "通胀", "Inflation": "通胀",
-            "recession": "衰退",
-
-            # 公司/企业
-            "CEO": "CEO", "Chief Executive": "首席执行官",
-            "CFO": "CFO",
-            "earnings": "财报", "Earnings": "财报",
-            "revenue": "营收", "Revenue": "营收",
-            "profit": "利润", "Profit": "利润",
-            "IPO": "IPO",
-
-            # 指数
-            "index": "指数", "indexes": "指数",
-            "Dow": "道指", "Dow Jones": "道琼斯指数",
-            "S&P": "标普", "S&P 500": "标普500",
-            "Nasdaq": "纳斯达克",
-
-            # 科技/AI
-            "AI": "AI", "Artificial Intelligence": "人工智能",
-            "Tech": "科技", "technology": "科技",
-            "tech sector": "科技板块",
-
-            # 银行金融
-            "Bank": "银行", "bank": "银行", "banks": "银行",
-            "Treasury": "财政部", "treasury": "国债",
-            "bond": "债券", "bonds": "债券",
-
-            # 加密货币
-            "Bitcoin": "比特币", "crypto": "加密货币",
-            "cryptocurrency": "加密货币",
-
-            # 商品
-            "oil": "石油", "Oil": "石油",
-            "gold": "黄金", "Gold": "黄金",
-
-            # 经济
-            "economy": "经济", "Economy": "经济",
-            "economic": "经济", "growth": "增长",
-            "GDP": "GDP",
-
-            # 地区
-            "US": "美国", "U.S.": "美国", "USA": "美国",
-            "China": "中国", "Chinese": "中国",
-            "Trump": "特朗普",
-            "tariff": "关税", "tariffs": "关税",
-
-            # 其他
-            "Volatility": "波动性", "volatility": "波动性",
-            "ETF": "ETF", "ETFs": "ETF",
-            "option": "期权", "options": "期权",
-            "fund": "基金", "funds": "基金",
-        }
-
-        result = text
-        for en, zh in terms.items():
-            pattern = r'\b' + re.escape(en) + r'\b'
-            result = re.sub(pattern, zh, result)
+        """快速翻译 - 使用关键词替换（单次扫描，结果缓存）"""
+        return self._translate_cached(text)
+
+    def _replace_terms(self, text: str) -> str:
+        """按术语表一次性替换所有术语（长词优先）"""
+        return self._pattern.sub(lambda m: self.glossary[m.group(0)], text)
 
+    async def translate_many(self, texts: Iterable[str]) -> Dict[str, str]:
+        """
+        批量翻译，返回 原文 -> 译文（中文和空文本原样返回）
+        模型后端会合并请求并缓存结果，失败的文本降级为关键词替换
+        """
+        result = {}
+        pending = []
+        for text in dict.fromkeys(texts):
+            if not text or not text.strip() or self.is_chinese(text):
+                result[text] = text
+            else:
+                pending.append(text)
+
+        if pending and self.backend == "llm":
+            if self._llm is None:
+                self._llm = LLMTranslator()
+            result.update(await self._llm.translate_many(pending))
+
+        for text in pending:
+            if text not in result:
+                result[text] = self._simple_translate(text)
         return result
 
     def translate_news_item(self, title: str, summary: str) -> tuple[str, str]:
@@ -116,9 +101,10 @@ class Translator:
         translated_summary = self.translate_to_chinese(summary)
         return translated_title, translated_summary
 
-    def close(self):
-        """关闭客户端"""
-        self.client.close()
+    async def aclose(self):
+        """关闭模型翻译客户端"""
+        if self._llm is not None:
+            await self._llm.aclose()
 
 
 # 全局翻译器实例
@@ -1,26 +1,93 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+import asyncio
+from collections import OrderedDict
+from contextvars import ContextVar
+from typing import Dict, List, Optional
 import httpx
 import logging
-from datetime import datetime
+from datetime import date, datetime
+from functools import lru_cache
 from app.models import NewsItem
+from scraper.connection_stats import ConnectionStats
+from scraper.resilience import CircuitBreaker, TokenBucket, backoff_delay
+from scraper.parse_pool import FeedEntry, parse_feed, parse_pool
+from scraper.timestamps import from_epoch, now
 
 logger = logging.getLogger(__name__)
 
+# 重试退避的基础间隔和上限（秒）
+RETRY_BASE_DELAY = 0.5
+RETRY_MAX_DELAY = 8.0
+# 单个请求的默认超时，以及预算内分到的最短超时（秒），剩余预算不足时不再发起请求
+REQUEST_TIMEOUT = 30.0
+MIN_REQUEST_TIMEOUT = 2.0
+# 浏览器渲染结束后留给读取和解析页面的时间（秒）
+RENDER_MARGIN = 1.0
+# 每个来源记住首次出现时间的链接数（超出按最早加入淘汰）
+FIRST_SEEN_SIZE = 5000
+
+# 本次抓取的截止时间（事件循环时间），由 fetch_within_budget 设置，每个抓取任务独立
+_deadline: ContextVar[Optional[float]] = ContextVar("scrape_deadline", default=None)
+
+USER_AGENT = "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36"
+
+
+def create_async_client() -> httpx.AsyncClient:
+    """创建带连接池的异步客户端（HTTP/2 + keep-alive，进程内长期复用）"""
+    return httpx.AsyncClient(
+        headers={"User-Agent": USER_AGENT},
+        timeout=REQUEST_TIMEOUT,
+        follow_redirects=True,
+        http2=True,
+        limits=httpx.Limits(
+            max_connections=20,
+            max_keepalive_connections=10,
+            keepalive_expiry=120.0
+        )
+    )
+
+
+@lru_cache(maxsize=64)
+def _target_day(target_date: str) -> date:
+    """解析目标日期 (YYYY-MM-DD)，同一日期只解析一次"""
+    return datetime.strptime(target_date, "%Y-%m-%d").date()
+
 
 class BaseScraper(ABC):
     """爬虫基类"""
 
-    def __init__(self):
-        self.client = httpx.Client(
-            headers={
-                "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36"
-            },
-            timeout=30.0,
-            follow_redirects=True
-        )
+    # 后台调度器的刷新间隔（秒）
+    refresh_interval: float = 300
+    # 单次抓取的超时预算（秒），包含重试和退避等待
+    timeout_budget: float = 30
+    # 预算中为备用方案（如浏览器渲染）保留的时间（秒），主请求的重试不会占用
+    fallback_reserve: float = 0
+    # 请求限速：每秒平均请求数和突发上限
+    rate_limit: float = 2.0
+    rate_burst: int = 5
+
+    def __init__(self, client: Optional[httpx.AsyncClient] = None):
+        # 每个来源持有自己的长连接客户端，生命周期与进程一致
+        self.client = client
+        self.stats = ConnectionStats()
+        # RSS 条件请求缓存: url -> {"etag", "last_modified", "entries"}（entries 为解析后的条目）
+        self._feed_cache: Dict[str, dict] = {}
         self.max_retries = 3
-        self._playwright_page = None
+        self.rate_limiter = TokenBucket(self.rate_limit, self.rate_burst)
+        # 连续失败后熔断，由 ScraperManager 在抓取前检查
+        self.breaker = CircuitBreaker()
+        # 聚合多个订阅源的来源记录各子源最近一次的抓取状态
+        self.feed_status: Dict[str, dict] = {}
+        # 发布时间无法解析、以首次发现时间代替的条目数
+        self.date_fallbacks = 0
+        # 链接 -> 首次发现时间：没有发布时间的条目每次抓取使用同一时间，去重键保持不变
+        self._first_seen: "OrderedDict[str, datetime]" = OrderedDict()
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """获取客户端（懒加载，仅在被关闭后才重建）"""
+        if self.client is None or self.client.is_closed:
+            self.client = create_async_client()
+        return self.client
 
     @abstractmethod
     def get_source_name(self) -> str:
@@ -28,62 +95,178 @@ class BaseScraper(ABC):
         pass
 
     @abstractmethod
-    def fetch_news(self, target_date: Optional[str] = None) -> List[NewsItem]:
-        """抓取新闻"""
+    async def fetch_news(self, target_date: Optional[str] = None, incremental: bool = False) -> List[NewsItem]:
+        """
+        抓取新闻
+        - incremental: 只返回上次增量抓取之后的新条目（支持游标的来源有效）
+        """
         pass
 
-    def _fetch_with_retry(self, url: str) -> Optional[str]:
-        """带重试的请求"""
+    async def fetch_within_budget(self, target_date: Optional[str] = None, incremental: bool = False) -> List[NewsItem]:
+        """按 timeout_budget 设置截止时间后抓取，请求超时和重试次数据此收缩（调用方负责超时取消）"""
+        _deadline.set(asyncio.get_running_loop().time() + self.timeout_budget)
+        return await self.fetch_news(target_date, incremental)
+
+    def _request_budget(self) -> Optional[float]:
+        """主请求还可使用的时间（秒，扣除备用方案的预留），不在预算内抓取时返回 None"""
+        deadline = _deadline.get()
+        if deadline is None:
+            return None
+        return deadline - asyncio.get_running_loop().time() - self.fallback_reserve
+
+    async def _fetch_with_retry(self, url: str, **kwargs) -> Optional[httpx.Response]:
+        """
+        带限速和重试的请求（指数退避 + 抖动），结果计入熔断器
+        在预算内抓取时，剩余时间平均分给剩余的尝试，不够一次请求时提前放弃，留出备用方案的时间
+        """
+        client = self._get_client()
+        extensions = {"trace": self.stats.trace}
+        timeout = kwargs.pop("timeout", REQUEST_TIMEOUT)
+        attempted = False
+
         for attempt in range(self.max_retries):
+            # 本轮抓取中已熔断，剩余请求直接放弃
+            if self.breaker.is_open:
+                return None
+
+            budget = self._request_budget()
+            request_timeout = timeout
+            if budget is not None:
+                if budget < MIN_REQUEST_TIMEOUT:
+                    logger.warning(f"{self.get_source_name()} 超时预算不足，停止重试")
+                    break
+                request_timeout = min(timeout, max(MIN_REQUEST_TIMEOUT, budget / (self.max_retries - attempt)))
+
+            retry_after = None
+            attempted = True
             try:
-                response = self.client.get(url)
-                response.raise_for_status()
-                return response.text
-            except Exception as e:
+                await self.rate_limiter.acquire()
+                # 请求失败只影响本次抓取，不关闭客户端，保留已建立的连接
+                response = await client.get(url, extensions=extensions, timeout=request_timeout, **kwargs)
+                # 304 为条件请求的正常结果，交给调用方处理
+                if response.status_code != 304:
+                    response.raise_for_status()
+                self.breaker.record_success()
+                return response
+            except httpx.HTTPStatusError as e:
+                status = e.response.status_code
                 logger.warning(f"{self.get_source_name()} 请求失败 (尝试 {attempt + 1}/{self.max_retries}): {e}")
-                if attempt == self.max_retries - 1:
+                # 除 429 外的 4xx 重试无意义，也不算来源故障
+                if 400 <= status < 500 and status != 429:
                     return None
+                retry_after = self._retry_after(e.response)
+            except Exception as e:
+                logger.warning(f"{self.get_source_name()} 请求失败 (尝试 {attempt + 1}/{self.max_retries}): {e}")
+
+            if attempt == self.max_retries - 1:
+                break
+            delay = max(backoff_delay(attempt, RETRY_BASE_DELAY, RETRY_MAX_DELAY), retry_after or 0)
+            budget = self._request_budget()
+            if budget is not None and budget - delay < MIN_REQUEST_TIMEOUT:
+                logger.warning(f"{self.get_source_name()} 超时预算不足，停止重试")
+                break
+            await asyncio.sleep(delay)
+
+        if attempted:
+            self.breaker.record_failure()
         return None
 
-    def _fetch_with_playwright(self, url: str, wait_selector: Optional[str] = None, wait_time: int = 3000) -> Optional[str]:
-        """使用 Playwright 获取 JavaScript 渲染的页面"""
+    def _retry_after(self, response: httpx.Response) -> Optional[float]:
+        """解析 Retry-After（秒数形式），不超过退避上限"""
         try:
-            from playwright.sync_api import sync_playwright
-
-            with sync_playwright() as p:
-                browser = p.chromium.launch(headless=True)
-                page = browser.new_page(
-                    user_agent="Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36"
-                )
-                page.goto(url, wait_until="domcontentloaded", timeout=30000)
-
-                # 等待特定元素出现
-                if wait_selector:
-                    try:
-                        page.wait_for_selector(wait_selector, timeout=10000)
-                    except:
-                        pass
-
-                # 额外等待时间让 JavaScript 执行
-                page.wait_for_timeout(wait_time)
-
-                content = page.content()
-                browser.close()
-                return content
+            return min(float(response.headers.get("Retry-After", "")), RETRY_MAX_DELAY)
+        except ValueError:
+            return None
+
+    async def _fetch_feed(self, url: str, max_entries: int = 50, **kwargs) -> Optional[List[FeedEntry]]:
+        """
+        获取并解析 RSS（条件请求）
+        带上次的 ETag / Last-Modified，304 时直接返回上次解析的条目
+        原始字节交给解析池处理，返回前 max_entries 条
+        """
+        cached = self._feed_cache.get(url)
+        headers = {}
+        if cached:
+            if cached["etag"]:
+                headers["If-None-Match"] = cached["etag"]
+            if cached["last_modified"]:
+                headers["If-Modified-Since"] = cached["last_modified"]
+
+        response = await self._fetch_with_retry(url, headers=headers, **kwargs)
+        if response is None:
+            return None
+
+        if response.status_code == 304 and cached:
+            logger.debug(f"{self.get_source_name()} RSS 未变化: {url}")
+            return cached["entries"]
+
+        entries = await parse_pool.run(parse_feed, response.content, max_entries)
+
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if etag or last_modified:
+            self._feed_cache[url] = {
+                "etag": etag,
+                "last_modified": last_modified,
+                "entries": entries
+            }
+        else:
+            self._feed_cache.pop(url, None)
+
+        return entries
+
+    async def _fetch_with_playwright(self, url: str, wait_selector: Optional[str] = None) -> Optional[str]:
+        """使用共享浏览器池获取 JavaScript 渲染的页面（在预算内抓取时，超时不超过剩余预算）"""
+        deadline = _deadline.get()
+        timeout = None
+        if deadline is not None:
+            timeout = deadline - asyncio.get_running_loop().time() - RENDER_MARGIN
+        try:
+            from scraper.browser_pool import browser_pool
+            return await browser_pool.fetch(url, wait_selector, timeout=timeout)
         except Exception as e:
             logger.error(f"{self.get_source_name()} Playwright 抓取失败: {e}")
             return None
 
+    def _first_seen_time(self, link: str) -> datetime:
+        """链接首次被发现的时间（北京时间），没有发布时间的条目以此代替"""
+        seen = self._first_seen.get(link)
+        if seen is None:
+            seen = self._first_seen[link] = now()
+            while len(self._first_seen) > FIRST_SEEN_SIZE:
+                self._first_seen.popitem(last=False)
+        return seen
+
+    def remember_first_seen(self, link: str, published: datetime):
+        """恢复已入库条目的时间（重启后同一条目仍得到相同的发布时间）"""
+        self._first_seen[link] = published
+        while len(self._first_seen) > FIRST_SEEN_SIZE:
+            self._first_seen.popitem(last=False)
+
+    def _published_time(self, entry: FeedEntry) -> datetime:
+        """RSS 条目的发布时间（北京时间），无法解析时以链接首次发现的时间代替并计数"""
+        if entry.published_ts is None:
+            self.date_fallbacks += 1
+            logger.debug(f"{self.get_source_name()} 发布时间无法解析: {entry.title}")
+            return self._first_seen_time(entry.link or entry.title)
+        return from_epoch(entry.published_ts)
+
+    def _match_date(self, dt: datetime, target_date: str) -> bool:
+        """检查日期（北京时间）是否匹配（目标日期格式错误时不过滤）"""
+        try:
+            return dt.date() == _target_day(target_date)
+        except ValueError:
+            return True
+
     def _format_datetime(self, dt: datetime) -> str:
         """格式化日期时间为 ISO 8601 格式"""
         return dt.isoformat()
 
-    def close(self):
-        """关闭客户端"""
-        self.client.close()
-
-    def __enter__(self):
-        return self
+    def pool_stats(self) -> dict:
+        """连接池统计：打开的连接数、复用率、握手次数"""
+        return self.stats.snapshot(self.client)
 
-    def __exit__(self, exc_type, exc_val, exc_tb):
-        self.close()
+    async def aclose(self):
+        """关闭客户端（仅在进程退出时调用）"""
+        if self.client is not None and not self.client.is_closed:
+            await self.client.aclose()
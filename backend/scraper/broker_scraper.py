@@ -1,102 +1,126 @@
-import feedparser
-from datetime import datetime
 from typing import List, Optional
+import asyncio
+import logging
+import time
 from scraper.base_scraper import BaseScraper
+from scraper.parse_pool import FeedEntry
+from scraper.timestamps import now
+from scraper.resilience import CircuitBreaker
 from app.models import NewsItem
-import httpx
+
+logger = logging.getLogger(__name__)
+
+
+# 券商研报RSS源
+RSS_SOURCES = [
+    # 头部券商研报
+    ("中金公司", "https://research.cicc.com/rss/research.xml"),
+    ("中信证券", "https://research.citics.com/rss/index.xml"),
+    ("国泰君安", "https://research.gtja.com/rss/research.xml"),
+    ("华泰证券", "https://research.htsc.com/rss/index.xml"),
+    ("招商证券", "https://research.cmschina.com/rss/index.xml"),
+    ("海通证券", "https://research.htsec.com/rss/index.xml"),
+    ("广发证券", "https://research.gf.com.cn/rss/index.xml"),
+    ("申万宏源", "https://research.swsresearch.com/rss/index.xml"),
+    ("兴业证券", "https://research.xyzq.com.cn/rss/index.xml"),
+    ("长江证券", "https://research.cjsc.com.cn/rss/index.xml"),
+]
+# 同时请求的订阅源数量
+FEED_CONCURRENCY = 5
+# 单个订阅源的请求超时（秒）
+FEED_TIMEOUT = 10
+# 整体截止时间（秒），到期返回已完成订阅源的结果
+FEED_DEADLINE = 20
 
 
 class BrokerScraper(BaseScraper):
-    """券商研报爬虫 - 聚合各大证券公司研究报告"""
+    """券商研报爬虫 - 聚合各大证券公司研究报告（多个订阅源并发抓取）"""
+
+    # 研报更新较慢
+    refresh_interval = 1800
+    # 截止时间之后留出解析余量
+    timeout_budget = FEED_DEADLINE + 5
+    # 各订阅源分属不同站点，放宽整体限速
+    rate_limit = 10.0
+    rate_burst = 10
+
+    def __init__(self, client=None):
+        super().__init__(client)
+        # 个别订阅源失效不应熔断整个来源：连续失败数达到订阅源总数才熔断
+        self.breaker = CircuitBreaker(failure_threshold=len(RSS_SOURCES))
 
     def get_source_name(self) -> str:
         return "券商研报"
 
-    def fetch_news(self, target_date: Optional[str] = None) -> List[NewsItem]:
+    async def fetch_news(self, target_date: Optional[str] = None, incremental: bool = False) -> List[NewsItem]:
+        """并发抓取各订阅源，按完成顺序解析；截止时间到达时返回已有结果"""
         items = []
+        semaphore = asyncio.Semaphore(FEED_CONCURRENCY)
+        started = time.monotonic()
 
-        # 券商研报RSS源
-        rss_sources = [
-            # 头部券商研报
-            ("中金公司", "https://research.cicc.com/rss/research.xml"),
-            ("中信证券", "https://research.citics.com/rss/index.xml"),
-            ("国泰君安", "https://research.gtja.com/rss/research.xml"),
-            ("华泰证券", "https://research.htsc.com/rss/index.xml"),
-            ("招商证券", "https://research.cmschina.com/rss/index.xml"),
-            ("海通证券", "https://research.htsec.com/rss/index.xml"),
-            ("广发证券", "https://research.gf.com.cn/rss/index.xml"),
-            ("申万宏源", "https://research.swsresearch.com/rss/index.xml"),
-            ("兴业证券", "https://research.xyzq.com.cn/rss/index.xml"),
-            ("长江证券", "https://research.cjsc.com.cn/rss/index.xml"),
-        ]
-
-        for source_name, rss_url in rss_sources:
-            try:
-                # 使用 httpx 获取RSS内容，设置更长的超时时间
-                response = self.client.get(rss_url, timeout=30)
-                if response.status_code != 200:
-                    continue
-
-                feed = feedparser.parse(response.content)
+        async def fetch_feed(rss_url: str):
+            async with semaphore:
+                return await self._fetch_feed(rss_url, max_entries=30, timeout=FEED_TIMEOUT)
 
-                for entry in feed.get('entries', [])[:30]:
+        tasks = {asyncio.create_task(fetch_feed(rss_url)): source_name for source_name, rss_url in RSS_SOURCES}
+        pending = set(tasks)
+        try:
+            while pending:
+                remaining = FEED_DEADLINE - (time.monotonic() - started)
+                if remaining <= 0:
+                    break
+                done, pending = await asyncio.wait(pending, timeout=remaining, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    source_name = tasks[task]
+                    elapsed = round(time.monotonic() - started, 2)
                     try:
-                        title = entry.get('title', '')
-                        link = entry.get('link', '')
-                        summary = entry.get('description', entry.get('summary', ''))
-                        published_str = entry.get('published', '')
-
-                        if not title or not link:
-                            continue
+                        entries = task.result()
+                    except Exception as e:
+                        logger.warning(f"{source_name} 研报源抓取异常: {e}")
+                        entries = None
+                    if entries is None:
+                        self.feed_status[source_name] = {"status": "failed", "count": 0, "elapsed": elapsed}
+                        continue
+                    parsed = self._parse_entries(source_name, entries, target_date)
+                    self.feed_status[source_name] = {"status": "ok", "count": len(parsed), "elapsed": elapsed}
+                    items.extend(parsed)
+        finally:
+            for task in pending:
+                task.cancel()
+                self.feed_status[tasks[task]] = {"status": "timeout", "count": 0, "elapsed": FEED_DEADLINE}
+
+        if pending:
+            logger.warning(f"{self.get_source_name()} 截止时间已到，{len(pending)} 个订阅源未完成，返回部分结果")
+        return items
 
-                        # 过滤掉非研报内容
-                        if not any(keyword in title for keyword in ['研报', '报告', '深度', '分析', '投资', '策略']):
-                            continue
+    def _parse_entries(self, source_name: str, entries: List[FeedEntry], target_date: Optional[str]) -> List[NewsItem]:
+        """解析单个订阅源的条目"""
+        items = []
+        for entry in entries:
+            try:
+                title, link = entry.title, entry.link
 
-                        published_dt = self._parse_date(published_str)
+                if not title or not link:
+                    continue
 
-                        if target_date and not self._match_date(published_dt, target_date):
-                            continue
+                # 过滤掉非研报内容
+                if not any(keyword in title for keyword in ['研报', '报告', '深度', '分析', '投资', '策略']):
+                    continue
 
-                        items.append(NewsItem(
-                            source=f"{source_name}研报",
-                            title=title.strip(),
-                            summary=self._clean_summary(summary),
-                            url=link,
-                            published_at=self._format_datetime(published_dt),
-                            fetched_at=self._format_datetime(datetime.now())
-                        ))
+                published_dt = self._published_time(entry)
 
-                    except Exception:
-                        continue
+                if target_date and not self._match_date(published_dt, target_date):
+                    continue
 
-                # 如果成功获取到数据，继续尝试其他源（聚合多个来源）
-                # 不 break，尝试获取所有可用源
+                items.append(NewsItem(
+                    source=f"{source_name}研报",
+                    title=title.strip(),
+                    summary=entry.summary,
+                    url=link,
+                    published_at=self._format_datetime(published_dt),
+                    fetched_at=self._format_datetime(now())
+                ))
 
             except Exception:
                 continue
-
         return items
-
-    def _parse_date(self, date_str: str) -> datetime:
-        """解析日期字符串"""
-        try:
-            from dateutil import parser
-            return parser.parse(date_str)
-        except:
-            return datetime.now()
-
-    def _match_date(self, dt: datetime, target_date: str) -> bool:
-        """检查日期是否匹配"""
-        try:
-            target = datetime.strptime(target_date, "%Y-%m-%d").date()
-            return dt.date() == target
-        except:
-            return True
-
-    def _clean_summary(self, text: str) -> str:
-        """清理 HTML 标签"""
-        from bs4 import BeautifulSoup
-        soup = BeautifulSoup(text, 'lxml')
-        text = soup.get_text(strip=True)
-        return text[:200] + "..." if len(text) > 200 else text
@@ -0,0 +1,138 @@
+import asyncio
+import logging
+from typing import List, Optional
+
+logger = logging.getLogger(__name__)
+
+# 同时打开的页面数上限
+MAX_PAGES = 4
+# 不加载的资源类型（只需要 DOM）
+BLOCKED_RESOURCE_TYPES = {"image", "font", "media"}
+# 页面加载超时（毫秒）
+NAVIGATION_TIMEOUT = 30000
+# 等待选择器或网络空闲的超时（毫秒）
+WAIT_TIMEOUT = 10000
+# 剩余时间不足此值（毫秒）时不再开始加载页面
+MIN_NAVIGATION_TIMEOUT = 1000
+
+
+class BrowserPool:
+    """
+    进程内共享的无头浏览器池
+    浏览器和上下文常驻复用，页面用完放回空闲列表，并限制同时打开的页面数
+    """
+
+    def __init__(self, max_pages: int = MAX_PAGES):
+        self.max_pages = max_pages
+        self._semaphore = asyncio.Semaphore(max_pages)
+        self._lock = asyncio.Lock()
+        self._playwright = None
+        self._browser = None
+        self._context = None
+        self._idle_pages: List = []
+
+    async def _block_resources(self, route):
+        """拦截图片、字体、媒体等资源"""
+        if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+            await route.abort()
+        else:
+            await route.continue_()
+
+    async def _ensure_context(self):
+        """启动（或在断开后重启）浏览器和共享上下文"""
+        async with self._lock:
+            if self._browser is not None and self._browser.is_connected():
+                return self._context
+
+            from playwright.async_api import async_playwright
+            from scraper.base_scraper import USER_AGENT
+
+            if self._playwright is None:
+                self._playwright = await async_playwright().start()
+            self._browser = await self._playwright.chromium.launch(headless=True)
+            self._context = await self._browser.new_context(user_agent=USER_AGENT)
+            await self._context.route("**/*", self._block_resources)
+            self._idle_pages.clear()
+            logger.info("无头浏览器已启动")
+            return self._context
+
+    async def _acquire_page(self):
+        context = await self._ensure_context()
+        while self._idle_pages:
+            page = self._idle_pages.pop()
+            if not page.is_closed():
+                return page
+        return await context.new_page()
+
+    async def _release_page(self, page):
+        if page.is_closed():
+            return
+        if len(self._idle_pages) < self.max_pages:
+            self._idle_pages.append(page)
+        else:
+            await page.close()
+
+    async def _discard_page(self, page):
+        try:
+            await page.close()
+        except Exception as e:
+            logger.debug(f"关闭页面失败: {e}")
+
+    @staticmethod
+    def _remaining_ms(deadline: Optional[float], limit: int) -> int:
+        """距截止时间的毫秒数，不超过 limit；没有截止时间时为 limit"""
+        if deadline is None:
+            return limit
+        return min(limit, int((deadline - asyncio.get_running_loop().time()) * 1000))
+
+    async def fetch(self, url: str, wait_selector: Optional[str] = None, timeout: Optional[float] = None) -> Optional[str]:
+        """
+        渲染页面并返回 HTML
+        指定 wait_selector 时等待该元素出现，否则等待网络空闲（不再固定等待）
+        timeout 为整体可用时间（秒，含等待页面和启动浏览器），页面加载和等待的超时据此收缩
+        """
+        deadline = asyncio.get_running_loop().time() + timeout if timeout is not None else None
+        async with self._semaphore:
+            page = await self._acquire_page()
+            done = False
+            try:
+                navigation_timeout = self._remaining_ms(deadline, NAVIGATION_TIMEOUT)
+                if navigation_timeout < MIN_NAVIGATION_TIMEOUT:
+                    raise asyncio.TimeoutError("浏览器抓取的剩余时间不足")
+                await page.goto(url, wait_until="domcontentloaded", timeout=navigation_timeout)
+                # Playwright 的超时为 0 表示不限时，剩余时间用完时直接读取页面
+                wait_timeout = self._remaining_ms(deadline, WAIT_TIMEOUT)
+                if wait_timeout > 0:
+                    try:
+                        if wait_selector:
+                            await page.wait_for_selector(wait_selector, timeout=wait_timeout)
+                        else:
+                            await page.wait_for_load_state("networkidle", timeout=wait_timeout)
+                    except Exception:
+                        # 超时后仍返回已渲染的内容
+                        pass
+                html = await page.content()
+                done = True
+                return html
+            finally:
+                if done:
+                    await self._release_page(page)
+                else:
+                    # 出错或被取消（如超出抓取预算）的页面可能仍在加载，不再复用
+                    await self._discard_page(page)
+
+    async def close(self):
+        """关闭浏览器"""
+        async with self._lock:
+            if self._browser is not None:
+                await self._browser.close()
+                self._browser = None
+                self._context = None
+            if self._playwright is not None:
+                await self._playwright.stop()
+                self._playwright = None
+            self._idle_pages.clear()
+
+
+# 全局浏览器池
+browser_pool = BrowserPool()
@@ -1,150 +1,181 @@
-from datetime import datetime
-from typing import List, Optional
+from typing import List, Optional, Set, Tuple
 from scraper.base_scraper import BaseScraper
+from scraper.parse_pool import parse_pool
+from scraper.timestamps import from_epoch, now
 from app.models import NewsItem
-import httpx
 import time
 
 
+# 电讯页面的候选选择器（按顺序尝试，命中即停止）
+TELEGRAPH_SELECTORS = [
+    'div[class*="telegraph"]',
+    'div[class*="item"]',
+    'article',
+    'a[href*="/telegraph/"]'
+]
+
+
+def parse_telegraph_html(html: str) -> List[Tuple[str, str]]:
+    """电讯页面 HTML -> [(标题, 链接)]（在解析进程中执行）"""
+    from bs4 import BeautifulSoup
+    soup = BeautifulSoup(html, 'lxml')
+
+    for selector in TELEGRAPH_SELECTORS:
+        telegraphs = []
+        for elem in soup.select(selector)[:50]:
+            title_elem = elem.select_one('a') or elem
+            title = title_elem.get_text(strip=True)
+
+            link = title_elem.get('href', '')
+            if link and not link.startswith('http'):
+                link = "https://www.cls.cn" + link
+
+            if title and link:
+                telegraphs.append((title, link))
+        if telegraphs:
+            return telegraphs
+    return []
+
+
 class ClsScraper(BaseScraper):
     """财联社爬虫 - 使用 API"""
 
+    # 电讯更新频繁，高频增量轮询
+    refresh_interval = 15
+    # 高频轮询的来源缩短超时预算，避免拖慢整体抓取
+    timeout_budget = 25
+    # API 重试只用预算的前一部分，失败时仍来得及走浏览器渲染的备用方案
+    fallback_reserve = 12
+
+    def __init__(self, client=None):
+        super().__init__(client)
+        # 增量游标：已见过的最新 ctime，以及该秒内已处理的电讯 id
+        self._last_ctime: Optional[int] = None
+        self._last_ids: Set[str] = set()
+
     def get_source_name(self) -> str:
         return "财联社"
 
-    def fetch_news(self, target_date: Optional[str] = None) -> List[NewsItem]:
+    async def fetch_news(self, target_date: Optional[str] = None, incremental: bool = False) -> List[NewsItem]:
         items = []
+        # 增量模式只请求游标之后的电讯（指定日期时总是全量）
+        use_cursor = incremental and not target_date and self._last_ctime is not None
         try:
             # 使用财联社的刷新电讯列表 API
             current_time = int(time.time())
             url = "https://www.cls.cn/nodeapi/refreshTelegraphList"
             params = {
                 "app": "CailianpressWeb",
-                "lastTime": current_time,
+                "lastTime": self._last_ctime if use_cursor else current_time,
                 "os": "web",
                 "sv": "8.4.6",
                 "sign": ""
             }
 
-            response = httpx.get(url, params=params, timeout=30)
-            if response.status_code == 200:
-                data = response.json()
-                if "l" in data:
-                    # data['l'] 是一个字典，key 是新闻 id
-                    for item_id, item_data in data["l"].items():
-                        try:
-                            title = item_data.get("brief", item_data.get("title", ""))
-                            content = item_data.get("content", title)
-
-                            if not title:
-                                continue
-
-                            # 构造链接
-                            link = f"https://www.cls.cn/telegraph/{item_id}"
-
-                            # 解析时间
-                            ctime = item_data.get("ctime", int(time.time()))
-                            published_dt = datetime.fromtimestamp(ctime)
-
-                            # 日期过滤
-                            if target_date and not self._match_date(published_dt, target_date):
-                                continue
-
-                            items.append(NewsItem(
-                                source=self.get_source_name(),
-                                title=title.strip(),
-                                summary=self._clean_summary(content),
-                                url=link,
-                                published_at=self._format_datetime(published_dt),
-                                fetched_at=self._format_datetime(datetime.now())
-                            ))
-
-                        except Exception:
+            response = await self._fetch_with_retry(url, params=params)
+            if response is None:
+                raise RuntimeError("财联社 API 请求失败")
+            data = response.json()
+            if "l" in data:
+                newest_ctime = self._last_ctime
+                newest_ids = set(self._last_ids)
+
+                # data['l'] 是一个字典，key 是新闻 id
+                for item_id, item_data in data["l"].items():
+                    try:
+                        ctime = item_data.get("ctime", current_time)
+
+                        # 增量模式跳过游标之前已处理的电讯，只构建新增部分
+                        if use_cursor and (ctime < self._last_ctime or (ctime == self._last_ctime and item_id in self._last_ids)):
                             continue
 
+                        if incremental and not target_date:
+                            if newest_ctime is None or ctime > newest_ctime:
+                                newest_ctime = ctime
+                                newest_ids = {item_id}
+                            elif ctime == newest_ctime:
+                                newest_ids.add(item_id)
+
+                        title = item_data.get("brief", item_data.get("title", ""))
+                        content = item_data.get("content", title)
+
+                        if not title:
+                            continue
+
+                        # 构造链接
+                        link = f"https://www.cls.cn/telegraph/{item_id}"
+
+                        # 解析时间
+                        published_dt = from_epoch(ctime)
+
+                        # 日期过滤
+                        if target_date and not self._match_date(published_dt, target_date):
+                            continue
+
+                        items.append(NewsItem(
+                            source=self.get_source_name(),
+                            title=title.strip(),
+                            summary=self._clean_summary(content),
+                            url=link,
+                            published_at=self._format_datetime(published_dt),
+                            fetched_at=self._format_datetime(now())
+                        ))
+
+                    except Exception:
+                        continue
+
+                if incremental and not target_date:
+                    self._last_ctime = newest_ctime
+                    self._last_ids = newest_ids
+
         except Exception as e:
             # API 失败时尝试网页抓取
-            items.extend(self._scrape_web(target_date))
+            items.extend(await self._scrape_web(target_date))
 
         return items
 
-    def _scrape_web(self, target_date: Optional[str] = None) -> List[NewsItem]:
+    async def _scrape_web(self, target_date: Optional[str] = None) -> List[NewsItem]:
         """网页解析备用方案 - 使用 Playwright"""
         items = []
         try:
-            html = self._fetch_with_playwright("https://www.cls.cn/telegraph", wait_time=5000)
+            # 等待电讯列表渲染出来即可，不再固定等待
+            html = await self._fetch_with_playwright(
+                "https://www.cls.cn/telegraph",
+                wait_selector='a[href*="/telegraph/"], div[class*="telegraph"]'
+            )
             if not html:
                 return items
 
-            from bs4 import BeautifulSoup
-            soup = BeautifulSoup(html, 'lxml')
-
-            # 查找电讯内容
-            selectors = [
-                'div[class*="telegraph"]',
-                'div[class*="item"]',
-                'article',
-                'a[href*="/telegraph/"]'
-            ]
-
-            for selector in selectors:
-                elements = soup.select(selector)
-                if elements:
-                    for elem in elements[:50]:
-                        try:
-                            title_elem = elem.select_one('a') or elem
-                            title = title_elem.get_text(strip=True)
-
-                            link = title_elem.get('href', '')
-                            if link and not link.startswith('http'):
-                                link = "https://www.cls.cn" + link
-
-                            if not title or not link:
-                                continue
-
-                            published_dt = datetime.now()
-
-                            if target_date and not self._match_date(published_dt, target_date):
-                                continue
-
-                            summary = title[:100] + "..." if len(title) > 100 else title
-
-                            items.append(NewsItem(
-                                source=self.get_source_name(),
-                                title=title,
-                                summary=summary,
-                                url=link,
-                                published_at=self._format_datetime(published_dt),
-                                fetched_at=self._format_datetime(datetime.now())
-                            ))
-
-                        except Exception:
-                            continue
+            # DOM 解析和选择器扫描交给解析池
+            telegraphs = await parse_pool.run(parse_telegraph_html, html)
+
+            for title, link in telegraphs:
+                try:
+                    # 网页上没有时间，以首次发现时间代替，重复抓取时保持不变
+                    published_dt = self._first_seen_time(link)
 
-                    if items:
-                        break
+                    if target_date and not self._match_date(published_dt, target_date):
+                        continue
+
+                    summary = title[:100] + "..." if len(title) > 100 else title
+
+                    items.append(NewsItem(
+                        source=self.get_source_name(),
+                        title=title,
+                        summary=summary,
+                        url=link,
+                        published_at=self._format_datetime(published_dt),
+                        fetched_at=self._format_datetime(now())
+                    ))
+
+                except Exception:
+                    continue
 
         except Exception:
             pass
 
         return items
 
-    def _parse_date(self, date_str: str) -> datetime:
-        """解析日期字符串"""
-        try:
-            from dateutil import parser
-            return parser.parse(date_str)
-        except:
-            return datetime.now()
-
-    def _match_date(self, dt: datetime, target_date: str) -> bool:
-        """检查日期是否匹配"""
-        try:
-            target = datetime.strptime(target_date, "%Y-%m-%d").date()
-            return dt.date() == target
-        except:
-            return True
-
     def _clean_summary(self, text: str) -> str:
         """清理摘要"""
         text = text.strip()
@@ -0,0 +1,43 @@
+from typing import Optional
+import httpx
+
+
+class ConnectionStats:
+    """
+    单个来源的连接池统计
+    通过 httpx 的 trace 扩展统计请求数、新建 TCP 连接数和 TLS 握手次数
+    """
+
+    def __init__(self):
+        self.requests = 0
+        self.new_connections = 0
+        self.tls_handshakes = 0
+
+    async def trace(self, event_name: str, info: dict):
+        """httpcore trace 回调（每个请求都会触发）"""
+        if event_name in ("http11.send_request_headers.started", "http2.send_request_headers.started"):
+            self.requests += 1
+        elif event_name == "connection.connect_tcp.complete":
+            self.new_connections += 1
+        elif event_name == "connection.start_tls.complete":
+            self.tls_handshakes += 1
+
+    @staticmethod
+    def open_connections(client: Optional[httpx.AsyncClient]) -> int:
+        """客户端连接池中当前保持的连接数"""
+        if client is None or client.is_closed:
+            return 0
+        pool = getattr(client._transport, "_pool", None)
+        connections = getattr(pool, "connections", None) or []
+        return sum(1 for conn in connections if not conn.is_closed())
+
+    def snapshot(self, client: Optional[httpx.AsyncClient]) -> dict:
+        """导出统计数据"""
+        reused = max(self.requests - self.new_connections, 0)
+        return {
+            "open_connections": self.open_connections(client),
+            "requests": self.requests,
+            "new_connections": self.new_connections,
+            "handshakes": self.tls_handshakes,
+            "reuse_ratio": round(reused / self.requests, 3) if self.requests else 0.0,
+        }
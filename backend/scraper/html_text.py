@@ -0,0 +1,65 @@
+import re
+from html.parser import HTMLParser
+from typing import List
+
+# 摘要最大长度（字符）
+SUMMARY_LENGTH = 200
+
+_WHITESPACE_RE = re.compile(r'\s+')
+# 内容不属于正文的标签
+_SKIP_TAGS = {"script", "style", "noscript", "template"}
+
+
+class _Enough(Exception):
+    """已收集到足够的文本，提前结束解析"""
+
+
+class _TextExtractor(HTMLParser):
+    """流式提取文本：丢弃标签，解码实体，收集到 limit 个字符后停止"""
+
+    def __init__(self, limit: int):
+        super().__init__(convert_charrefs=True)
+        self.limit = limit
+        self.parts: List[str] = []
+        self.length = 0
+        self._skip_depth = 0
+
+    def handle_starttag(self, tag, attrs):
+        if tag in _SKIP_TAGS:
+            self._skip_depth += 1
+
+    def handle_endtag(self, tag):
+        if tag in _SKIP_TAGS and self._skip_depth:
+            self._skip_depth -= 1
+
+    def handle_data(self, data):
+        if self._skip_depth:
+            return
+        chunk = _WHITESPACE_RE.sub(' ', data)
+        self.parts.append(chunk)
+        self.length += len(chunk)
+        if self.length > self.limit:
+            raise _Enough()
+
+
+def html_to_text(html: str, limit: int = SUMMARY_LENGTH) -> str:
+    """
+    HTML 转纯文本摘要（超过 limit 截断并加省略号）
+    不构建 DOM，读到足够的字符即停止；纯文本直接处理
+    """
+    if not html:
+        return ""
+
+    if '<' not in html and '&' not in html:
+        text = _WHITESPACE_RE.sub(' ', html).strip()
+    else:
+        # 多收集一些字符，抵消首尾空白
+        extractor = _TextExtractor(limit + 2)
+        try:
+            extractor.feed(html)
+            extractor.close()
+        except _Enough:
+            pass
+        text = _WHITESPACE_RE.sub(' ', "".join(extractor.parts)).strip()
+
+    return text[:limit] + "..." if len(text) > limit else text
@@ -1,7 +1,6 @@
-import feedparser
-from datetime import datetime
 from typing import List, Optional
 from scraper.base_scraper import BaseScraper
+from scraper.timestamps import now
 from app.models import NewsItem
 
 
@@ -11,24 +10,23 @@ class HuxiuScraper(BaseScraper):
     def get_source_name(self) -> str:
         return "虎嗅"
 
-    def fetch_news(self, target_date: Optional[str] = None) -> List[NewsItem]:
+    async def fetch_news(self, target_date: Optional[str] = None, incremental: bool = False) -> List[NewsItem]:
         items = []
         try:
             # 虎嗅 RSS
-            feed = feedparser.parse("https://www.huxiu.com/rss/0.xml")
+            entries = await self._fetch_feed("https://www.huxiu.com/rss/0.xml")
+            if entries is None:
+                return items
 
-            for entry in feed.get('entries', [])[:50]:
+            for entry in entries:
                 try:
-                    title = entry.get('title', '')
-                    link = entry.get('link', '')
-                    summary = entry.get('description', entry.get('summary', ''))
-                    published_str = entry.get('published', '')
+                    title, link = entry.title, entry.link
 
                     if not title or not link:
                         continue
 
-                    # 解析发布时间
-                    published_dt = self._parse_date(published_str)
+                    # 发布时间（已在解析阶段处理）
+                    published_dt = self._published_time(entry)
 
                     # 日期过滤
                     if target_date and not self._match_date(published_dt, target_date):
@@ -37,10 +35,10 @@ class HuxiuScraper(BaseScraper):
                     items.append(NewsItem(
                         source=self.get_source_name(),
                         title=title.strip(),
-                        summary=self._clean_summary(summary),
+                        summary=entry.summary,
                         url=link,
                         published_at=self._format_datetime(published_dt),
-                        fetched_at=self._format_datetime(datetime.now())
+                        fetched_at=self._format_datetime(now())
                     ))
 
                 except Exception:
@@ -50,26 +48,3 @@ class HuxiuScraper(BaseScraper):
             pass
 
         return items
-
-    def _parse_date(self, date_str: str) -> datetime:
-        """解析日期字符串"""
-        try:
-            from dateutil import parser
-            return parser.parse(date_str)
-        except:
-            return datetime.now()
-
-    def _match_date(self, dt: datetime, target_date: str) -> bool:
-        """检查日期是否匹配"""
-        try:
-            target = datetime.strptime(target_date, "%Y-%m-%d").date()
-            return dt.date() == target
-        except:
-            return True
-
-    def _clean_summary(self, html: str) -> str:
-        """清理 HTML 标签"""
-        from bs4 import BeautifulSoup
-        soup = BeautifulSoup(html, 'lxml')
-        text = soup.get_text(strip=True)
-        return text[:200] + "..." if len(text) > 200 else text
@@ -1,80 +1,141 @@
-from typing import List, Optional, Tuple
-from concurrent.futures import ThreadPoolExecutor, as_completed, TimeoutError as FutureTimeoutError
+from typing import Dict, Iterable, List, Optional, Tuple
+import asyncio
 from scraper.base_scraper import BaseScraper
+from scraper.browser_pool import browser_pool
+from scraper.parse_pool import parse_pool
 from scraper.cls_scraper import ClsScraper
 from scraper.kr36_scraper import Kr36Scraper
 from scraper.huxiu_scraper import HuxiuScraper
+from scraper.broker_scraper import BrokerScraper
+from scraper.single_flight import SingleFlight
+from scraper.timestamps import from_epoch
 from app.models import NewsItem
 import logging
 
 logger = logging.getLogger(__name__)
 
-# 单个爬虫超时时间（秒）
-SCRAPER_TIMEOUT = 30
-# 整体抓取超时时间（秒）
+# 整体抓取超时时间（秒），单个来源的超时预算见各爬虫的 timeout_budget
 TOTAL_TIMEOUT = 60
 
 
 class ScraperManager:
-    """爬虫管理器 - 支持并发抓取和超时控制"""
+    """爬虫管理器 - 基于 asyncio 的并发抓取和超时控制"""
 
     def __init__(self):
+        # 每个爬虫持有自己的长连接客户端，抓取结束后不关闭
         self.scrapers: List[BaseScraper] = [
             ClsScraper(),         # 财联社（API）
             Kr36Scraper(),        # 36氪（科技资讯）
             HuxiuScraper(),       # 虎嗅（商业资讯）
+            BrokerScraper(),      # 券商研报（多订阅源并发）
         ]
+        # 单来源抓取合并进行中的相同请求（后台调度器和手动抓取同时触发时共用一次）
+        self._source_flights = SingleFlight()
 
-    def _fetch_single(self, scraper: BaseScraper, target_date: Optional[str] = None) -> Tuple[List[NewsItem], Optional[str]]:
+    async def _fetch_single(self, scraper: BaseScraper, target_date: Optional[str] = None, incremental: bool = False) -> Tuple[List[NewsItem], Optional[str]]:
         """
-        抓取单个来源
+        抓取单个来源（按该来源的超时预算，熔断中的来源直接跳过）
         返回: (新闻列表, 失败的来源名称，None表示成功)
         """
+        name = scraper.get_source_name()
+        breaker = scraper.breaker
+        if not breaker.allow():
+            logger.info(f"{name} 熔断中，跳过本次抓取")
+            return [], name
+
+        probing = breaker.state == breaker.HALF_OPEN
         try:
-            with scraper:
-                items = scraper.fetch_news(target_date)
-                logger.info(f"{scraper.get_source_name()} 抓取到 {len(items)} 条新闻")
-                return items, None
+            items = await asyncio.wait_for(scraper.fetch_within_budget(target_date, incremental), timeout=scraper.timeout_budget)
+            logger.info(f"{name} 抓取到 {len(items)} 条新闻")
+        except asyncio.TimeoutError:
+            logger.error(f"{name} 抓取超时 (> {scraper.timeout_budget}秒)")
+            # 超时被取消的请求没有记录结果
+            breaker.record_failure()
+            return [], name
         except Exception as e:
-            logger.error(f"{scraper.get_source_name()} 抓取失败: {e}")
-            return [], scraper.get_source_name()
+            logger.error(f"{name} 抓取失败: {e}")
+            # 请求失败已由 _fetch_with_retry 计入；探测中的其他异常也算探测失败
+            if breaker.state == breaker.HALF_OPEN:
+                breaker.record_failure()
+            return [], name
+
+        if probing and breaker.state == breaker.HALF_OPEN:
+            # 探测期间没有发出请求（如全部命中缓存），按成功处理
+            breaker.record_success()
+        if breaker.is_open:
+            return items, name
+        return items, None
+
+    async def fetch_source(self, scraper: BaseScraper, target_date: Optional[str] = None, incremental: bool = False) -> Tuple[List[NewsItem], Optional[str]]:
+        """抓取单个来源（供后台调度器按来源独立刷新），同一来源进行中的相同抓取会被合并"""
+        key = (scraper.get_source_name(), target_date, incremental)
+        return await self._source_flights.do(key, lambda: self._fetch_single(scraper, target_date, incremental))
 
-    def fetch_all(self, target_date: Optional[str] = None) -> tuple[List[NewsItem], List[str]]:
+    def select_scrapers(self, sources: Optional[Iterable[str]] = None) -> List[BaseScraper]:
+        """按来源名称选择爬虫，未指定时返回全部"""
+        if not sources:
+            return list(self.scrapers)
+        names = set(sources)
+        return [scraper for scraper in self.scrapers if scraper.get_source_name() in names]
+
+    async def fetch_all_async(self, target_date: Optional[str] = None, incremental: bool = False, sources: Optional[Iterable[str]] = None) -> Tuple[List[NewsItem], List[str]]:
         """
         并发抓取所有来源新闻
+        - incremental: 增量模式，支持游标的来源只返回新增条目
+        - sources: 只抓取指定来源，可选
         返回: (新闻列表, 失败的来源列表)
         """
         all_items = []
         failed_sources = []
 
-        with ThreadPoolExecutor(max_workers=len(self.scrapers)) as executor:
-            # 提交所有任务
-            future_to_scraper = {
-                executor.submit(self._fetch_single, scraper, target_date): scraper
-                for scraper in self.scrapers
-            }
-
-            # 收集结果（带超时）
-            for future in as_completed(future_to_scraper, timeout=TOTAL_TIMEOUT):
-                scraper = future_to_scraper[future]
-                try:
-                    items, failed = future.result(timeout=SCRAPER_TIMEOUT)
-                    all_items.extend(items)
-                    if failed:
-                        failed_sources.append(failed)
-                except FutureTimeoutError:
-                    logger.error(f"{scraper.get_source_name()} 抓取超时 (> {SCRAPER_TIMEOUT}秒)")
-                    failed_sources.append(scraper.get_source_name())
-                except Exception as e:
-                    logger.error(f"{scraper.get_source_name()} 执行异常: {e}")
-                    failed_sources.append(scraper.get_source_name())
+        tasks = {
+            asyncio.create_task(self.fetch_source(scraper, target_date, incremental)): scraper
+            for scraper in self.select_scrapers(sources)
+        }
+
+        # 收集结果（带整体超时）
+        done, pending = await asyncio.wait(tasks, timeout=TOTAL_TIMEOUT)
+
+        for task in done:
+            scraper = tasks[task]
+            try:
+                items, failed = task.result()
+                all_items.extend(items)
+                if failed:
+                    failed_sources.append(failed)
+            except Exception as e:
+                logger.error(f"{scraper.get_source_name()} 执行异常: {e}")
+                failed_sources.append(scraper.get_source_name())
+
+        for task in pending:
+            scraper = tasks[task]
+            task.cancel()
+            logger.error(f"{scraper.get_source_name()} 整体抓取超时 (> {TOTAL_TIMEOUT}秒)")
+            failed_sources.append(scraper.get_source_name())
 
         return all_items, failed_sources
 
-    def close_all(self):
-        """关闭所有爬虫"""
+    def restore_first_seen(self, entries: Iterable[Tuple[str, str, int]]):
+        """用已入库条目的 (来源, 链接, 发布时间戳) 恢复各爬虫的首次发现时间（按时间升序传入）"""
+        by_name = {scraper.get_source_name(): scraper for scraper in self.scrapers}
+        for source, url, published_ts in entries:
+            scraper = by_name.get(source)
+            if scraper is not None:
+                scraper.remember_first_seen(url, from_epoch(published_ts))
+
+    def pool_stats(self) -> Dict[str, dict]:
+        """各来源的连接池统计"""
+        return {scraper.get_source_name(): scraper.pool_stats() for scraper in self.scrapers}
+
+    async def close_all(self):
+        """关闭所有爬虫的客户端、共享浏览器和解析进程池"""
         for scraper in self.scrapers:
             try:
-                scraper.close()
+                await scraper.aclose()
             except Exception:
                 pass
+        try:
+            await browser_pool.close()
+        except Exception:
+            pass
+        parse_pool.close()
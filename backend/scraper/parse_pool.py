@@ -0,0 +1,77 @@
+import asyncio
+import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, List, NamedTuple, Optional
+import feedparser
+from scraper.html_text import html_to_text
+from scraper.timestamps import parse_entry_time
+
+logger = logging.getLogger(__name__)
+
+# 解析进程数：0 表示不启用进程池，在默认线程池中解析（仍不阻塞事件循环）
+PARSE_WORKERS = int(os.getenv("PARSE_WORKERS", "0"))
+
+
+class FeedEntry(NamedTuple):
+    """解析后的 RSS 条目（只含基本类型，跨进程传输开销小）"""
+    title: str
+    link: str
+    summary: str
+    # 发布时间 epoch 秒，无法解析时为 None
+    published_ts: Optional[float]
+
+
+def parse_feed(content: bytes, max_entries: int) -> List[FeedEntry]:
+    """
+    RSS 原始字节 -> 条目列表（在解析进程中执行）
+    只处理前 max_entries 条，摘要在这里转为纯文本
+    """
+    entries = []
+    for entry in feedparser.parse(content).get('entries', [])[:max_entries]:
+        published = parse_entry_time(entry)
+        entries.append(FeedEntry(
+            title=entry.get('title', ''),
+            link=entry.get('link', ''),
+            summary=html_to_text(entry.get('description', entry.get('summary', ''))),
+            published_ts=published.timestamp() if published else None
+        ))
+    return entries
+
+
+class ParsePool:
+    """
+    解析阶段：抓取只取回原始字节，CPU 密集的解析交给进程池，不占用事件循环和 GIL
+    workers 为 0 时在当前进程的默认线程池中解析
+    """
+
+    def __init__(self, workers: int = PARSE_WORKERS):
+        self.workers = workers
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        """懒加载进程池（spawn 启动，避免 fork 带走事件循环和连接状态）"""
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context("spawn")
+            )
+            logger.info(f"解析进程池已启动，共 {self.workers} 个进程")
+        return self._executor
+
+    async def run(self, fn: Callable[..., Any], *args) -> Any:
+        """执行解析函数（须为模块级函数，参数和结果可序列化）"""
+        loop = asyncio.get_running_loop()
+        executor = self._get_executor() if self.workers > 0 else None
+        return await loop.run_in_executor(executor, fn, *args)
+
+    def close(self):
+        """关闭进程池"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+# 全局解析池
+parse_pool = ParsePool()
@@ -0,0 +1,97 @@
+import asyncio
+import random
+import time
+
+# 连续失败多少次后熔断
+BREAKER_FAILURE_THRESHOLD = 5
+# 熔断后多久允许一次半开探测（秒）
+BREAKER_COOLDOWN = 60
+# 探测失败后冷却时间翻倍的上限（秒）
+BREAKER_MAX_COOLDOWN = 600
+
+
+def backoff_delay(attempt: int, base: float, cap: float) -> float:
+    """指数退避 + 全抖动：在 [0, min(cap, base * 2^attempt)] 中随机取值"""
+    return random.uniform(0, min(cap, base * (2 ** attempt)))
+
+
+class TokenBucket:
+    """令牌桶限速：平均每秒 rate 个请求，允许 capacity 个突发"""
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self):
+        """取一个令牌，不足时等待（按先后顺序）"""
+        async with self._lock:
+            self._refill()
+            if self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+                self._refill()
+            self._tokens -= 1
+
+
+class CircuitBreaker:
+    """
+    熔断器：连续失败达到阈值后熔断，冷却期内直接跳过该来源
+    冷却结束后放行一次半开探测，成功则恢复，失败则继续熔断（冷却时间翻倍）
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int = BREAKER_FAILURE_THRESHOLD, cooldown: float = BREAKER_COOLDOWN,
+                 max_cooldown: float = BREAKER_MAX_COOLDOWN):
+        self.failure_threshold = failure_threshold
+        self.base_cooldown = cooldown
+        self.max_cooldown = max_cooldown
+        self.cooldown = cooldown
+        self.state = self.CLOSED
+        self.failures = 0
+        self._opened_at = 0.0
+
+    def allow(self) -> bool:
+        """是否放行本次抓取；冷却结束后的第一次调用成为半开探测"""
+        if self.state == self.CLOSED:
+            return True
+        if self.state == self.OPEN and time.monotonic() - self._opened_at >= self.cooldown:
+            self.state = self.HALF_OPEN
+            return True
+        # 熔断中，或已有探测在进行
+        return False
+
+    @property
+    def is_open(self) -> bool:
+        return self.state == self.OPEN
+
+    def record_success(self):
+        self.failures = 0
+        self.cooldown = self.base_cooldown
+        self.state = self.CLOSED
+
+    def record_failure(self):
+        self.failures += 1
+        if self.state == self.HALF_OPEN:
+            self.cooldown = min(self.cooldown * 2, self.max_cooldown)
+            self._trip()
+        elif self.state == self.CLOSED and self.failures >= self.failure_threshold:
+            self._trip()
+
+    def _trip(self):
+        self.state = self.OPEN
+        self._opened_at = time.monotonic()
+
+    def snapshot(self) -> dict:
+        """熔断状态（供监控接口）"""
+        retry_in = max(0.0, self.cooldown - (time.monotonic() - self._opened_at)) if self.state == self.OPEN else 0.0
+        return {"state": self.state, "failures": self.failures, "retry_in": round(retry_in, 1)}
@@ -0,0 +1,47 @@
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Dict, Hashable, Tuple
+
+
+class SingleFlight:
+    """
+    合并并发的相同请求：同一个键同时只执行一次，其余调用方等待并共享结果
+    - ttl: 成功结果的复用时间（秒），用于吸收突发请求；0 表示只合并进行中的请求
+    """
+
+    def __init__(self, ttl: float = 0):
+        self.ttl = ttl
+        self._inflight: Dict[Hashable, asyncio.Task] = {}
+        # 键 -> (完成时间, 结果)
+        self._recent: Dict[Hashable, Tuple[float, Any]] = {}
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """执行或加入 key 对应的请求；异常会传给所有等待者，且不缓存"""
+        recent = self._recent.get(key)
+        if recent is not None:
+            if time.monotonic() - recent[0] < self.ttl:
+                return recent[1]
+            del self._recent[key]
+
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(fn())
+            self._inflight[key] = task
+            task.add_done_callback(lambda t: self._finish(key, t))
+
+        # shield：某个调用方被取消（如客户端断开）不影响共享的请求
+        return await asyncio.shield(task)
+
+    def _finish(self, key: Hashable, task: asyncio.Task):
+        """请求完成：移出进行中列表，成功结果按 ttl 保留"""
+        self._inflight.pop(key, None)
+        if self.ttl > 0 and not task.cancelled() and task.exception() is None:
+            now = time.monotonic()
+            # 顺带清理过期结果，避免不同键（日期）累积
+            for stale in [k for k, (done_at, _) in self._recent.items() if now - done_at >= self.ttl]:
+                del self._recent[stale]
+            self._recent[key] = (now, task.result())
+
+    def inflight(self) -> int:
+        """进行中的请求数"""
+        return len(self._inflight)
@@ -0,0 +1,71 @@
+import calendar
+import logging
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+from typing import Optional
+from app.record import CST
+
+logger = logging.getLogger(__name__)
+
+# 时间字符串解析结果缓存（同一订阅源的条目常有相同的时间字符串，重复抓取时也会再次出现）
+PARSE_CACHE_SIZE = 4096
+
+
+def now() -> datetime:
+    """当前北京时间（带时区）"""
+    return datetime.now(CST)
+
+
+def from_epoch(ts: float) -> datetime:
+    """epoch 秒转为北京时间"""
+    return datetime.fromtimestamp(ts, CST)
+
+
+def _normalize(dt: datetime) -> datetime:
+    """统一为北京时间；不带时区的时间按北京时间处理"""
+    if dt.tzinfo is None:
+        return dt.replace(tzinfo=CST)
+    return dt.astimezone(CST)
+
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def parse_timestamp(value: str) -> Optional[datetime]:
+    """
+    解析时间字符串，返回北京时间，无法解析时返回 None
+    依次尝试 ISO 8601、RFC 822，最后才使用 dateutil 通用解析
+    """
+    value = value.strip()
+    if not value:
+        return None
+    try:
+        return _normalize(datetime.fromisoformat(value))
+    except ValueError:
+        pass
+    try:
+        return _normalize(parsedate_to_datetime(value))
+    except (TypeError, ValueError, IndexError):
+        pass
+    try:
+        from dateutil import parser
+        dt = _normalize(parser.parse(value))
+        logger.debug(f"时间字符串走通用解析: {value}")
+        return dt
+    except (ValueError, OverflowError):
+        return None
+
+
+def parse_entry_time(entry: dict) -> Optional[datetime]:
+    """
+    RSS 条目的发布时间（北京时间）
+    优先使用 feedparser 已解析好的 published_parsed / updated_parsed（UTC），不再重复解析字符串
+    """
+    for key in ('published_parsed', 'updated_parsed'):
+        parsed = entry.get(key)
+        if parsed:
+            return datetime.fromtimestamp(calendar.timegm(parsed), timezone.utc).astimezone(CST)
+    for key in ('published', 'updated'):
+        value = entry.get(key)
+        if value:
+            return parse_timestamp(value)
+    return None
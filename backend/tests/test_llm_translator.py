@@ -0,0 +1,85 @@
+import asyncio
+import json
+import httpx
+from app.llm_translator import LLMTranslator, TranslationCache
+
+STUB_URL = "http://stub.local/api/generate"
+
+
+class StubOllama:
+    """本地桩服务：记录每个请求的批次和并发数，译文为 "译:" + 原文"""
+
+    def __init__(self, delay: float = 0.01):
+        self.delay = delay
+        self.batches = []
+        self.models = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        payload = json.loads(request.content)
+        texts = json.loads(payload["prompt"].rsplit("\n", 1)[1])
+        self.batches.append(texts)
+        self.models.append(payload["model"])
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.in_flight -= 1
+        body = json.dumps({"translations": [f"译:{text}" for text in texts]}, ensure_ascii=False)
+        return httpx.Response(200, json={"response": body})
+
+
+def make_translator(stub: StubOllama, cache: TranslationCache, model: str = "stub-model", **kwargs) -> LLMTranslator:
+    client = httpx.AsyncClient(transport=httpx.MockTransport(stub))
+    return LLMTranslator(url=STUB_URL, model=model, cache=cache, client=client, **kwargs)
+
+
+def test_batches_dedupes_and_limits_in_flight(tmp_path):
+    stub = StubOllama()
+    cache = TranslationCache(str(tmp_path / "translations.db"))
+    translator = make_translator(stub, cache, batch_size=3, max_in_flight=2)
+    texts = [f"headline {i}" for i in range(10)] + ["headline 0", "headline 1", "", "  "]
+
+    result = asyncio.run(translator.translate_many(texts))
+
+    assert result == {f"headline {i}": f"译:headline {i}" for i in range(10)}
+    assert sorted(len(batch) for batch in stub.batches) == [1, 3, 3, 3]
+    assert sorted(text for batch in stub.batches for text in batch) == sorted(f"headline {i}" for i in range(10))
+    assert stub.max_in_flight == 2
+    cache.close()
+
+
+def test_cache_hits_skip_requests(tmp_path):
+    stub = StubOllama()
+    cache = TranslationCache(str(tmp_path / "translations.db"))
+    translator = make_translator(stub, cache)
+
+    asyncio.run(translator.translate_many(["Oil prices jump"]))
+    result = asyncio.run(translator.translate_many(["Oil prices jump", "Gold hits record"]))
+
+    assert result == {"Oil prices jump": "译:Oil prices jump", "Gold hits record": "译:Gold hits record"}
+    assert stub.batches == [["Oil prices jump"], ["Gold hits record"]]
+    cache.close()
+
+
+def test_cache_is_keyed_by_model(tmp_path):
+    stub = StubOllama()
+    cache = TranslationCache(str(tmp_path / "translations.db"))
+
+    asyncio.run(make_translator(stub, cache, model="old-model").translate_many(["Oil prices jump"]))
+    asyncio.run(make_translator(stub, cache, model="new-model").translate_many(["Oil prices jump"]))
+
+    assert stub.models == ["old-model", "new-model"]
+    cache.close()
+
+
+def test_failed_batch_is_not_cached(tmp_path):
+    cache = TranslationCache(str(tmp_path / "translations.db"))
+    client = httpx.AsyncClient(transport=httpx.MockTransport(lambda request: httpx.Response(500)))
+    translator = LLMTranslator(url=STUB_URL, model="stub-model", cache=cache, client=client)
+
+    assert asyncio.run(translator.translate_many(["Oil prices jump"])) == {}
+    assert cache.get_many(["Oil prices jump"], "stub-model") == {}
+    cache.close()
@@ -0,0 +1,84 @@
+import time
+from app.near_dedup import NearDuplicateDetector
+from app.record import NewsRecord, sources
+
+
+def make_record(source: str, title: str, published_ts: int = None, summary: str = "") -> NewsRecord:
+    ts = int(time.time()) if published_ts is None else published_ts
+    return NewsRecord(sources.intern(source), title, summary, f"https://example.com/{source}/{hash(title)}", ts, ts)
+
+
+def test_cross_source_repost_is_merged():
+    detector = NearDuplicateDetector()
+    first = make_record("财联社", "央行宣布下调存款准备金率0.5个百分点")
+    repost = make_record("新浪财经", "【央行宣布下调存款准备金率0.5个百分点】")
+
+    assert detector.filter([first, repost]) == [first]
+    assert first.related_sources == ["新浪财经"]
+    assert len(detector.clusters()) == 1
+
+
+def test_templated_titles_with_different_subject_are_kept():
+    detector = NearDuplicateDetector()
+    apple = make_record("Reuters", "Apple shares rise 3% after earnings")
+    tesla = make_record("Bloomberg", "Tesla shares rise 3% after earnings")
+
+    assert detector.filter([apple, tesla]) == [apple, tesla]
+
+
+def test_titles_with_different_numbers_are_kept():
+    detector = NearDuplicateDetector()
+    up = make_record("财联社", "A股三大指数集体收涨 沪指涨0.5%")
+    down = make_record("新浪财经", "A股三大指数集体收跌 沪指跌0.8%")
+    other_figure = make_record("东方财富", "A股三大指数集体收涨 沪指涨0.8%")
+
+    assert detector.filter([up, down, other_figure]) == [up, down, other_figure]
+
+
+def test_same_source_items_are_never_dropped():
+    detector = NearDuplicateDetector()
+    items = [make_record("财联社", f"{name}股价涨停 成交额放大") for name in ("宁德时代", "宁德时代 ")]
+    items += [make_record("财联社", "Tesla shares rise 3% after earnings") for _ in range(2)]
+
+    assert detector.filter(items) == items
+
+
+def test_templated_batch_is_not_collapsed():
+    detector = NearDuplicateDetector()
+    companies = ["Apple", "Tesla", "Nvidia", "Amazon", "Google", "Meta",
+                 "Netflix", "Intel", "AMD", "Oracle", "Adobe", "Cisco"]
+    items = [make_record(f"source{i % 3}", f"{name} shares rise 3% after earnings")
+             for i, name in enumerate(companies)]
+
+    assert len(detector.filter(items)) == len(companies)
+
+
+def test_reposts_outside_time_window_are_kept():
+    detector = NearDuplicateDetector(time_window=3600)
+    now = int(time.time())
+    today = make_record("财联社", "央行开展1000亿元逆回购操作", now)
+    earlier = make_record("新浪财经", "央行开展1000亿元逆回购操作", now - 2 * 3600)
+
+    assert detector.filter([today, earlier]) == [today, earlier]
+
+
+def test_expired_clusters_are_evicted():
+    detector = NearDuplicateDetector(time_window=3600)
+    detector.filter([make_record("财联社", "央行开展1000亿元逆回购操作", int(time.time()) - 2 * 3600)])
+    detector.filter([make_record("新浪财经", "美联储宣布维持利率不变")])
+
+    assert len(detector) == 1
+
+
+def test_restored_related_sources_rebuild_cluster():
+    detector = NearDuplicateDetector()
+    canonical = make_record("财联社", "央行开展1000亿元逆回购操作")
+    canonical.related_sources = ["新浪财经"]
+    repost = make_record("新浪财经", "【央行开展1000亿元逆回购操作】")
+    third = make_record("东方财富", "央行开展1000亿元逆回购操作！")
+
+    assert detector.filter([canonical]) == [canonical]
+    assert detector.filter([repost, third]) == []
+    assert canonical.related_sources == ["新浪财经", "东方财富"]
+    assert detector.take_updated() == [canonical]
+    assert detector.take_updated() == []
@@ -0,0 +1,17 @@
+import time
+from app.record import NewsRecord, sources
+from app.repository import NewsRepository
+
+
+def test_related_sources_are_persisted(tmp_path):
+    repository = NewsRepository(str(tmp_path / "news.db"))
+    ts = int(time.time())
+    record = NewsRecord(sources.intern("财联社"), "央行开展1000亿元逆回购操作", "", "https://example.com/1", ts, ts)
+    repository.add_many([record])
+
+    record.related_sources = ["新浪财经", "东方财富"]
+    assert repository.update_related_sources([record]) == 1
+
+    restored = repository.query(since=ts - 1)
+    assert [r.related_sources for r in restored] == [["新浪财经", "东方财富"]]
+    repository.close()
@@ -0,0 +1,26 @@
+from app.response_cache import EncodedResponse
+
+
+def make_response() -> EncodedResponse:
+    return EncodedResponse(b'[' + b'{"title": "news"},' * 200 + b'{}]')
+
+
+def test_match_echoes_matched_variant():
+    encoded = make_response()
+    gzip_etag = encoded.select("gzip")[2]
+
+    assert encoded.match(gzip_etag, "gzip") == gzip_etag
+    assert encoded.match(f'W/{gzip_etag}', "gzip") == gzip_etag
+    assert encoded.match(f'"other", "{encoded.etag}"') == f'"{encoded.etag}"'
+
+
+def test_match_star_uses_negotiated_variant():
+    encoded = make_response()
+    assert encoded.match("*", "gzip") == encoded.select("gzip")[2]
+
+
+def test_match_rejects_unknown_tags():
+    encoded = make_response()
+    assert encoded.match('"other"') is None
+    assert encoded.match(f'"{encoded.etag}-zstd"') is None
+    assert encoded.match(None) is None
@@ -38,7 +38,14 @@ class NewsListPage extends StatefulWidget {
 class _NewsListPageState extends State<NewsListPage> {
   final List<NewsItem> _newsItems = [];
   final TextEditingController _searchController = TextEditingController();
+  final ScrollController _scrollController = ScrollController();
   bool _isLoading = false;
+  bool _isLoadingMore = false;
+  bool _loadMoreFailed = false;
+  String? _nextCursor;
+  String? _keywords;
+  // 列表每次重新加载时递增，用于丢弃旧列表的翻页结果
+  int _listGeneration = 0;
   String? _errorMessage;
   DateTime? _lastUpdateTime;
   String _selectedDate = '';
@@ -48,9 +55,17 @@ class _NewsListPageState extends State<NewsListPage> {
   void initState() {
     super.initState();
     _selectedDate = DateFormat('yyyy-MM-dd').format(DateTime.now());
+    _scrollController.addListener(_maybeLoadMore);
     _checkServerHealth();
   }
 
+  @override
+  void dispose() {
+    _scrollController.dispose();
+    _searchController.dispose();
+    super.dispose();
+  }
+
   Future<void> _checkServerHealth() async {
     final isOnline = await ApiService.checkHealth();
     setState(() {
@@ -91,22 +106,31 @@ class _NewsListPageState extends State<NewsListPage> {
         keywords: keywords != null ? [keywords] : null,
       );
 
-      final news = await ApiService.getNews(
+      // 只拉取第一页，滚动到底部时再加载更多
+      final page = await ApiService.getNewsPage(
         date: null,  // 不过滤日期，获取所有新闻
         keywords: keywords,
       );
+      final news = page.items;
 
       final lastUpdate = await ApiService.getLastUpdate();
 
       setState(() {
+        _listGeneration++;
         _newsItems.clear();
         _newsItems.addAll(news);
+        _nextCursor = page.nextCursor;
+        _keywords = keywords;
+        _isLoadingMore = false;
+        _loadMoreFailed = false;
         // 按发布时间倒序排列（最新的在最上面）
         _newsItems.sort((a, b) => b.publishedAt.compareTo(a.publishedAt));
         _lastUpdateTime = lastUpdate;
         _isLoading = false;
         _errorMessage = news.isEmpty ? '暂无数据，请刷新' : null;
       });
+      // 第一页不足一屏时不会产生滚动，布局完成后检查一次
+      WidgetsBinding.instance.addPostFrameCallback((_) => _maybeLoadMore());
 
       if (mounted) {
         ScaffoldMessenger.of(context).showSnackBar(
@@ -124,6 +148,52 @@ class _NewsListPageState extends State<NewsListPage> {
     }
   }
 
+  /// 滚动接近底部时加载下一页（加载失败后需点击重试，不自动重复请求）
+  void _maybeLoadMore() {
+    if (!_scrollController.hasClients || _loadMoreFailed) return;
+    if (_scrollController.position.extentAfter < 300) {
+      _loadMore();
+    }
+  }
+
+  Future<void> _loadMore() async {
+    if (_isLoadingMore || _nextCursor == null) return;
+
+    final generation = _listGeneration;
+    final cursor = _nextCursor;
+    final keywords = _keywords;
+    setState(() {
+      _isLoadingMore = true;
+      _loadMoreFailed = false;
+    });
+
+    try {
+      final page = await ApiService.getNewsPage(
+        keywords: keywords,
+        cursor: cursor,
+      );
+      // 请求期间列表已重新加载，丢弃这一页
+      if (!mounted ||
+          generation != _listGeneration ||
+          cursor != _nextCursor ||
+          keywords != _keywords) {
+        return;
+      }
+      setState(() {
+        _newsItems.addAll(page.items);
+        _nextCursor = page.nextCursor;
+        _isLoadingMore = false;
+      });
+      WidgetsBinding.instance.addPostFrameCallback((_) => _maybeLoadMore());
+    } catch (e) {
+      if (!mounted || generation != _listGeneration) return;
+      setState(() {
+        _isLoadingMore = false;
+        _loadMoreFailed = true;
+      });
+    }
+  }
+
   Future<void> _pickDate() async {
     final now = DateTime.now();
     final picked = await showDatePicker(
@@ -315,9 +385,26 @@ class _NewsListPageState extends State<NewsListPage> {
     return RefreshIndicator(
       onRefresh: () => _fetchNews(showLoading: false),
       child: ListView.builder(
+        controller: _scrollController,
         itemCount: _newsItems.length + 1,
         itemBuilder: (context, index) {
           if (index == _newsItems.length) {
+            // 还有下一页：加载中显示指示器，失败时显示重试按钮
+            if (_nextCursor != null) {
+              if (_loadMoreFailed) {
+                return Center(
+                  child: TextButton.icon(
+                    onPressed: _loadMore,
+                    icon: const Icon(Icons.refresh),
+                    label: const Text('加载失败，点击重试'),
+                  ),
+                );
+              }
+              return const Padding(
+                padding: EdgeInsets.all(16),
+                child: Center(child: CircularProgressIndicator()),
+              );
+            }
             return _lastUpdateTime != null
                 ? Container(
                     padding: const EdgeInsets.all(16),
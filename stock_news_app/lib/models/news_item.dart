@@ -21,8 +21,8 @@ class NewsItem {
       title: json['title'] as String,
       summary: json['summary'] as String,
       url: json['url'] as String,
-      publishedAt: DateTime.parse(json['published_at'] as String),
-      fetchedAt: DateTime.parse(json['fetched_at'] as String),
+      publishedAt: DateTime.parse(json['published_at'] as String).toLocal(),
+      fetchedAt: DateTime.parse(json['fetched_at'] as String).toLocal(),
     );
   }
 
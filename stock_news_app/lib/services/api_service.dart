@@ -2,11 +2,22 @@ import 'dart:convert';
 import 'package:http/http.dart' as http;
 import '../models/news_item.dart';
 
+/// 新闻分页结果
+class NewsPage {
+  final List<NewsItem> items;
+  // 下一页游标，为空表示没有更多
+  final String? nextCursor;
+
+  NewsPage({required this.items, this.nextCursor});
+}
+
 class ApiService {
   // 本地开发环境
   static const String baseUrl = 'http://localhost:8000';
   // 生产环境: 'http://124.222.203.221'
   static const Duration timeout = Duration(seconds: 60);
+  // 每页条数
+  static const int pageSize = 50;
 
   /// 健康检查
   static Future<bool> checkHealth() async {
@@ -76,6 +87,38 @@ class ApiService {
     }
   }
 
+  /// 分页获取新闻列表（按游标翻页）
+  static Future<NewsPage> getNewsPage({
+    String? date,
+    String? keywords,
+    String? cursor,
+    int limit = pageSize,
+  }) async {
+    try {
+      final queryParams = <String, String>{'limit': '$limit'};
+      if (date != null) queryParams['date'] = date;
+      if (keywords != null) queryParams['keywords'] = keywords;
+      if (cursor != null) queryParams['cursor'] = cursor;
+
+      final uri = Uri.parse('$baseUrl/news')
+          .replace(queryParameters: queryParams);
+
+      final response = await http.get(uri).timeout(timeout);
+
+      if (response.statusCode == 200) {
+        final List<dynamic> jsonList = jsonDecode(response.body) as List;
+        return NewsPage(
+          items: jsonList.map((json) => NewsItem.fromJson(json as Map<String, dynamic>)).toList(),
+          nextCursor: response.headers['x-next-cursor'],
+        );
+      } else {
+        throw Exception('获取新闻失败: ${response.statusCode}');
+      }
+    } catch (e) {
+      throw Exception('获取新闻失败: $e');
+    }
+  }
+
   /// 获取上次更新时间
   static Future<DateTime?> getLastUpdate() async {
     try {